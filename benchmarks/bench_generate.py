@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Benchmark scaffold generation throughput.
+
+Times create_project_structure() across project counts, schedule sizes and
+output backends, and reports files/sec, bytes/sec, file operations (the
+open/mkdir/stat/chmod/... calls actually made, counted by wrapping them),
+read()/write() call counts from /proc/self/io and peak RSS. Each case runs
+in a fresh worker process so peak RSS and I/O counters are not polluted by
+earlier cases.
+
+The "disk" backend writes below --disk-dir, which defaults to .cache/bench
+in the repository, so it measures the disk the working tree lives on rather
+than whatever the temporary directory is (often a tmpfs).
+
+Usage:
+    python benchmarks/bench_generate.py --save results.json
+    python benchmarks/bench_generate.py --baseline results.json --threshold 0.15
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import builtins
+import resource
+import tempfile
+import contextlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import generate_project
+
+BACKENDS = ("memory", "tmpfs", "disk")
+TMPFS_DIR = "/dev/shm"
+DISK_DIR = os.path.join(REPO_ROOT, ".cache", "bench")
+# File system calls counted as file operations: (module, function name)
+COUNTED_CALLS = ((builtins, "open"), (os, "open"), (os, "mkdir"), (os, "stat"), (os, "chmod"),
+                 (os, "fsync"), (os, "remove"), (os, "replace"))
+
+class CountingSink(generate_project.ForwardingSink):
+    """Forward entries to another sink while counting directories, files and bytes"""
+
+    def __init__(self, inner):
+        super().__init__(inner)
+        self.directories = 0
+        self.files = 0
+        self.bytes = 0
+
+    def makedirs(self, path):
+        self.directories += 1
+        super().makedirs(path)
+
+    def write(self, path, data, mode=None):
+        self.files += 1
+        self.bytes += len(data)
+        super().write(path, data, mode)
+
+@contextlib.contextmanager
+def count_file_ops():
+    """
+    Count the COUNTED_CALLS made inside the block, by name.
+
+    The functions are replaced on their modules, so calls made through
+    os.makedirs, os.path.isfile and the like are counted as the mkdir and
+    stat calls they make.
+    """
+    counts = Counter()
+    originals = [(module, name, getattr(module, name)) for module, name in COUNTED_CALLS]
+
+    def counting(label, function):
+        def wrapper(*args, **kwargs):
+            counts[label] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    for module, name, function in originals:
+        setattr(module, name, counting(name, function))
+    try:
+        yield counts
+    finally:
+        for module, name, function in originals:
+            setattr(module, name, function)
+
+def _read_proc_io():
+    """Return the process's read()/write() call counters (syscr/syscw), or None off Linux"""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(":") for line in f if ":" in line)
+        return {"syscr": int(fields["syscr"]), "syscw": int(fields["syscw"])}
+    except (OSError, KeyError, ValueError):
+        return None
+
+def _peak_rss_kb():
+    """Return peak RSS of this process in KiB (ru_maxrss is bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def _run_case(projects, weeks, days_per_week, backend, repeat, disk_dir=DISK_DIR):
+    """Run one benchmark case in the current (fresh) process and return its metrics"""
+    schedule = generate_project.Schedule(weeks, days_per_week)
+    titles = [f"Bench_Project_{i}" for i in range(projects)]
+
+    # Warm up catalog and template caches so every repeat measures the same work
+    for _ in generate_project.iter_project_files(titles[0], schedule=generate_project.Schedule(1, 1)):
+        pass
+
+    if backend == "disk":
+        os.makedirs(disk_dir, exist_ok=True)
+    timings = []
+    file_ops = Counter()
+    io_before = _read_proc_io()
+    for _ in range(repeat):
+        root = None
+        if backend == "memory":
+            sink = CountingSink(generate_project.MemorySink())
+        else:
+            root = tempfile.mkdtemp(prefix="bench-generate-", dir=TMPFS_DIR if backend == "tmpfs" else disk_dir)
+            sink = CountingSink(generate_project.FileSystemSink(root))
+        try:
+            with count_file_ops() as ops:
+                start = time.perf_counter()
+                for title in titles:
+                    generate_project.create_project_structure(title, sink=sink, schedule=schedule)
+                sink.close()
+                timings.append(time.perf_counter() - start)
+            file_ops += ops
+        finally:
+            if root:
+                shutil.rmtree(root, ignore_errors=True)
+    io_after = _read_proc_io()
+
+    best = min(timings)
+    result = {
+        "projects": projects,
+        "weeks": weeks,
+        "days_per_week": days_per_week,
+        "backend": backend,
+        "files": sink.files,
+        "directories": sink.directories,
+        "bytes": sink.bytes,
+        "file_ops_per_run": sum(file_ops.values()) // repeat,
+        "file_ops_by_call": {name: count // repeat for name, count in sorted(file_ops.items())},
+        "best_seconds": best,
+        "mean_seconds": sum(timings) / len(timings),
+        "files_per_sec": sink.files / best,
+        "bytes_per_sec": sink.bytes / best,
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+    if io_before and io_after:
+        result["read_calls_per_run"] = (io_after["syscr"] - io_before["syscr"]) // repeat
+        result["write_calls_per_run"] = (io_after["syscw"] - io_before["syscw"]) // repeat
+    return result
+
+def case_key(case):
+    return f"{case['projects']}p-{case['weeks']}x{case['days_per_week']}-{case['backend']}"
+
+def run_benchmarks(project_counts, schedules, backends, repeat, disk_dir=DISK_DIR):
+    """Run every combination of the given dimensions and return the list of results"""
+    results = []
+    for projects in project_counts:
+        for weeks, days_per_week in schedules:
+            for backend in backends:
+                if backend == "tmpfs" and not os.path.isdir(TMPFS_DIR):
+                    print(f"⚠️  Skipping tmpfs backend: {TMPFS_DIR} does not exist", file=sys.stderr)
+                    continue
+                with ProcessPoolExecutor(max_workers=1) as pool:
+                    case = pool.submit(_run_case, projects, weeks, days_per_week, backend, repeat, disk_dir).result()
+                results.append(case)
+                print(f"{case_key(case):<24} {case['files']:>7} files  {case['best_seconds'] * 1000:9.1f} ms  "
+                      f"{case['files_per_sec']:10.0f} files/s  {case['bytes_per_sec'] / 1e6:8.1f} MB/s  "
+                      f"{case['file_ops_per_run']:>7} file ops  {case.get('write_calls_per_run', '-')!s:>7} write()s  "
+                      f"{case['peak_rss_kb'] / 1024:6.1f} MiB RSS")
+    return results
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Compare files/sec against a stored baseline.
+
+    Returns:
+        A list of (case_key, baseline_files_per_sec, current_files_per_sec)
+        for every case that slowed down by more than threshold
+    """
+    previous = {case_key(case): case for case in baseline["results"]}
+    regressions = []
+    for case in results:
+        old = previous.get(case_key(case))
+        if old and case["files_per_sec"] < old["files_per_sec"] * (1 - threshold):
+            regressions.append((case_key(case), old["files_per_sec"], case["files_per_sec"]))
+    return regressions
+
+def _parse_schedule(text):
+    weeks, _, days = text.partition("x")
+    return int(weeks), int(days or 5)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scaffold generation throughput")
+    parser.add_argument("--projects", type=int, nargs="+", default=[1, 10], help="Project counts to benchmark")
+    parser.add_argument("--schedules", type=_parse_schedule, nargs="+", default=[(24, 5), (52, 7)],
+                        help="Schedule sizes as WEEKSxDAYS (default: 24x5 52x7)")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS), help="Output backends to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the best time is reported")
+    parser.add_argument("--disk-dir", default=DISK_DIR, help="Directory the disk backend writes below (default: .cache/bench in the repository)")
+    parser.add_argument("--save", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed files/sec slowdown vs. baseline (default: 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.projects, args.schedules, args.backends, args.repeat, args.disk_dir)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for key, old, new in regressions:
+            print(f"❌ {key}: {old:.0f} -> {new:.0f} files/s ({(1 - new / old) * 100:.1f}% slower)")
+        if regressions:
+            return 1
+        print(f"✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Serve a local mock of the GitHub API endpoints that provision.py uses.
+
+Repositories, labels, issues and git objects are kept in memory, so a second
+provisioning run sees what the first one created, and trees are
+content-addressed, so pushing unchanged files yields the branch's current
+tree. Failures the client has to survive can be injected:
+
+  --rate-limit    the first label POST hits a secondary rate limit and the
+                  first GraphQL mutation returns RATE_LIMITED
+  --lose-create   creating a repository whose name starts with PREFIX
+                  succeeds, but the connection drops before the response
+                  body is sent
+  --close-idle    every connection is closed after one response without
+                  telling the client, so each pooled connection is stale
+                  the next time it is used
+
+Usage:
+    python benchmarks/mock_github.py --port 8799 --rate-limit --close-idle &
+    GITHUB_TOKEN=x python provision.py --api-url http://127.0.0.1:8799 --weekly-issues
+"""
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BRANCH = "main"
+
+def object_sha(kind, content):
+    """Return a content address for a mock git object"""
+    return hashlib.sha1(kind.encode() + b"\0" + json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+class MockGitHub:
+    """
+    In-memory state of the mock organisation.
+
+    handle() maps one request to (status, body, headers); a status of None
+    means the response is lost after the request took effect.
+    """
+
+    def __init__(self, rate_limit=False, lose_create=None):
+        self.repos = {}
+        self.trees = {}
+        self.commits = {}
+        self.lose_create = lose_create
+        self.pending_limits = {"labels": rate_limit, "mutation": rate_limit}
+        self.requests = Counter()
+        self.connections = 0
+        self._issue_numbers = Counter()
+        self._lock = threading.Lock()
+
+    def _store_tree(self, entries):
+        sha = object_sha("tree", entries)
+        self.trees[sha] = entries
+        return sha
+
+    def _store_commit(self, message, tree, parents):
+        commit = {"message": message, "tree": tree, "parents": parents}
+        sha = object_sha("commit", commit)
+        self.commits[sha] = commit
+        return sha
+
+    def _create_repo(self, org, payload):
+        name = payload["name"]
+        if name in self.repos:
+            return 422, {"message": "Repository creation failed.", "errors": [{"message": "name already exists on this account"}]}
+        repo = {"node_id": f"R_{org}_{name}", "labels": {}, "issues": [], "head": None}
+        if payload.get("auto_init"):
+            tree = self._store_tree({"README.md": ["100644", f"# {name}\n"]})
+            repo["head"] = self._store_commit("Initial commit", tree, [])
+        self.repos[name] = repo
+        if self.lose_create and name.startswith(self.lose_create):
+            return None, None
+        return 201, {"name": name, "node_id": repo["node_id"]}
+
+    def _graphql(self, payload):
+        query = payload["query"]
+        variables = payload.get("variables") or {}
+        if not query.lstrip().startswith("mutation"):
+            data = {}
+            errors = []
+            for alias, name in re.findall(r'(\w+): repository\(owner: \$owner, name: "([^"]+)"\)', query):
+                repo = self.repos.get(name)
+                data[alias] = {"id": repo["node_id"]} if repo else None
+                if not repo:
+                    errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve to a Repository with the name '{name}'."})
+            return 200, {"data": data, "errors": errors} if errors else {"data": data}, {}
+        if self.pending_limits["mutation"]:
+            self.pending_limits["mutation"] = False
+            headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(int(time.time()) + 1)}
+            return 200, {"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}, headers
+        by_id = {repo["node_id"]: repo for repo in self.repos.values()}
+        data = {}
+        for alias, variable in re.findall(r"(\w+): createIssue\(input: \$(\w+)\)", query):
+            issue = variables[variable]
+            repo = by_id[issue["repositoryId"]]
+            self._issue_numbers[issue["repositoryId"]] += 1
+            number = self._issue_numbers[issue["repositoryId"]]
+            repo["issues"].append({"number": number, "title": issue["title"], "labelIds": issue.get("labelIds", [])})
+            data[alias] = {"issue": {"number": number}}
+        return 200, {"data": data}, {}
+
+    def handle(self, method, path, payload):
+        with self._lock:
+            self.requests[method] += 1
+            if path == "/graphql" and method == "POST":
+                return self._graphql(payload)
+            match = re.fullmatch(r"/orgs/([^/]+)/repos", path)
+            if match and method == "POST":
+                status, body = self._create_repo(match.group(1), payload)
+                return status, body, {}
+            match = re.fullmatch(r"/repos/[^/]+/([^/]+)(/.*)?", path.split("?")[0])
+            repo = self.repos.get(match.group(1)) if match else None
+            if repo is None:
+                return 404, {"message": "Not Found"}, {}
+            return self._repo_request(repo, method, match.group(2) or "", payload)
+
+    def _repo_request(self, repo, method, route, payload):
+        if route == "" and method == "GET":
+            return 200, {"node_id": repo["node_id"]}, {}
+        if route == "/labels" and method == "POST":
+            if self.pending_limits["labels"]:
+                self.pending_limits["labels"] = False
+                return 403, {"message": "You have exceeded a secondary rate limit."}, {"retry-after": "1"}
+            if payload["name"] in repo["labels"]:
+                return 422, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}, {}
+            repo["labels"][payload["name"]] = f"LA_{len(repo['labels'])}_{payload['name']}"
+            return 201, {"name": payload["name"]}, {}
+        if route == "/labels" and method == "GET":
+            return 200, [{"name": name, "node_id": node_id} for name, node_id in repo["labels"].items()], {}
+        if route == f"/git/ref/heads/{DEFAULT_BRANCH}" and method == "GET" and repo["head"]:
+            return 200, {"object": {"sha": repo["head"]}}, {}
+        match = re.fullmatch(r"/git/commits/(\w+)", route)
+        if match and method == "GET" and match.group(1) in self.commits:
+            return 200, {"sha": match.group(1), "tree": {"sha": self.commits[match.group(1)]["tree"]}}, {}
+        if route == "/git/trees" and method == "POST":
+            entries = dict(self.trees.get(payload.get("base_tree"), {}))
+            for entry in payload["tree"]:
+                entries[entry["path"]] = [entry["mode"], entry["content"]]
+            return 201, {"sha": self._store_tree(entries)}, {}
+        if route == "/git/commits" and method == "POST":
+            if payload["tree"] not in self.trees:
+                return 422, {"message": "Tree SHA does not exist"}, {}
+            return 201, {"sha": self._store_commit(payload["message"], payload["tree"], payload["parents"])}, {}
+        if route == f"/git/refs/heads/{DEFAULT_BRANCH}" and method == "PATCH":
+            if payload["sha"] not in self.commits:
+                return 422, {"message": "Object does not exist"}, {}
+            repo["head"] = payload["sha"]
+            return 200, {"object": {"sha": repo["head"]}}, {}
+        return 404, {"message": "Not Found"}, {}
+
+    def summary(self):
+        commits = sum(1 for sha, commit in self.commits.items() if commit["parents"])
+        return (f"{sum(self.requests.values())} requests ({dict(self.requests)}) over {self.connections} connections; "
+                f"{len(self.repos)} repositories, {commits} pushed commits, "
+                f"{sum(len(repo['issues']) for repo in self.repos.values())} issues")
+
+def make_handler(state, close_idle=False):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with state._lock:
+                state.connections += 1
+
+        def log_message(self, format, *args):
+            pass
+
+        def _route(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length)) if length else None
+            status, body, headers = state.handle(self.command, self.path, payload)
+            if status is None:
+                # Headers only: the request was applied but its response never arrives
+                self.send_response(201)
+                self.send_header("Content-Length", "64")
+                self.end_headers()
+                self.wfile.flush()
+                self.close_connection = True
+                return
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            if close_idle:
+                # No "Connection: close": the client keeps the socket and finds it closed later
+                self.close_connection = True
+
+        do_GET = do_POST = do_PATCH = _route
+
+    return Handler
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a mock of the GitHub API used by provision.py")
+    parser.add_argument("--port", type=int, default=8799, help="Port to listen on; 0 picks a free one (default: 8799)")
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds (default: run until interrupted)")
+    parser.add_argument("--rate-limit", action="store_true", help="Rate-limit the first label POST and the first GraphQL mutation")
+    parser.add_argument("--lose-create", metavar="PREFIX", help="Drop the response to creating repositories whose name starts with PREFIX")
+    parser.add_argument("--close-idle", action="store_true", help="Close each connection after one response without announcing it")
+    args = parser.parse_args(argv)
+
+    state = MockGitHub(args.rate_limit, args.lose_create)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(state, args.close_idle))
+    server.daemon_threads = True
+    print(f"🧪 Mock GitHub API on http://127.0.0.1:{server.server_address[1]}", flush=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        if args.duration is None:
+            thread.join()
+        else:
+            time.sleep(args.duration)
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    print(f"📊 {state.summary()}", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,409 +1,1802 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
+import json
+import time
+import io
+import pickle
+import shlex
+import stat
+import tarfile
+import threading
+import zipfile
+import hashlib
+import string
+import functools
 import shutil
+import argparse
+import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-def create_project_structure(project_title):
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_PROBLEM_STATEMENT = "Configuration drift occurs when the actual state of infrastructure (particularly Kubernetes clusters) diverges from the desired state defined in Git repositories. This project aims to develop a comprehensive tool to detect, report, and remediate drift across multiple clusters and environments."
+
+# Templates are compiled once into static byte chunks and named slots. List
+# values are rendered as markdown bullet lists.
+WEEK_README_TEMPLATE = """\
+# Week {week}: {theme}
+
+## Weekly Objectives
+
+{objectives}
+## Daily Tasks
+
+{daily_tasks}"""
+
+PROJECT_README_TEMPLATE = """\
+# {title}
+
+## Problem Statement
+
+{description}
+
+## Project Structure
+
+This repository contains a {weeks}-week DevOps/SRE internship project broken down into daily tasks.
+
+### Getting Started
+
+1. Start with the Week 1, Day 1 tasks
+2. Follow the day-by-day progression
+3. Complete the daily reflections
+4. Reach out to mentors as needed
+
+### Repository Structure
+
+- `/setup`: Environment setup scripts and guides
+- `/resources`: Reference materials and documentation
+- `/weekly_tasks`: Daily task breakdowns organized by week
+"""
+
+SETUP_README_TEMPLATE = """\
+# Environment Setup
+
+This directory contains scripts and guides to set up your development environment for the {title} project.
+
+## Requirements
+
+- Computer with at least 8GB RAM, 4 CPU cores
+- 20GB free disk space
+- Git installed
+- Docker installed
+- Python 3.8+ installed
+
+## Setup Script
+
+Run the following command to set up your environment:
+
+```bash
+./setup.sh
+```
+"""
+
+SETUP_SCRIPT_TEMPLATE = """\
+#!/bin/bash
+
+# {title} Project Setup Script
+
+{install}
+echo "Setup completed successfully!"
+"""
+
+KUBECTL_SETUP = """\
+# Install kubectl
+curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/amd64/kubectl"
+chmod +x kubectl
+sudo mv kubectl /usr/local/bin/
+"""
+
+MINIKUBE_SETUP = """\
+# Install minikube
+curl -LO https://storage.googleapis.com/minikube/releases/latest/minikube-linux-amd64
+chmod +x minikube-linux-amd64
+sudo mv minikube-linux-amd64 /usr/local/bin/minikube
+
+# Start minikube
+minikube start
+"""
+
+HELM_SETUP = """\
+# Install Helm
+curl -fsSL https://raw.githubusercontent.com/helm/helm/main/scripts/get-helm-3 | bash
+"""
+
+DOCKER_SETUP = """\
+# Check Docker
+command -v docker >/dev/null || echo "Docker is required: https://docs.docker.com/get-docker/"
+"""
+
+# Setup steps per tool (lowercase name): (pip packages, shell blocks)
+TOOL_SETUP = {
+    "python": ([], []),
+    "github actions": ([], []),
+    "git": ([], []),
+    "docker": ([], [DOCKER_SETUP]),
+    "kubernetes": (["kubernetes"], [KUBECTL_SETUP, MINIKUBE_SETUP]),
+    "helm": ([], [HELM_SETUP]),
+    "prometheus": (["prometheus-client"], []),
+    "fastapi": (["fastapi", "uvicorn"], []),
+    "mlflow": (["mlflow"], []),
+    "dvc": (["dvc"], []),
+    "feast": (["feast"], []),
+    "great expectations": (["great_expectations"], []),
+    "kubeflow": (["kfp"], []),
+    "ray": (["ray"], []),
+    "apache airflow": (["apache-airflow"], []),
+    "grafana": ([], []),
+}
+
+DEFAULT_SETUP_PACKAGES = ["kubernetes", "pyyaml", "requests", "rich"]
+DEFAULT_SETUP_BLOCKS = [KUBECTL_SETUP, MINIKUBE_SETUP]
+
+def render_setup_commands(tools=None):
     """
-    Create the full project structure including all markdown files
-    with comprehensive content.
+    Return the install section of setup.sh for a list of tool names.
+    
+    Tools without an entry in TOOL_SETUP are listed for manual installation.
+    Without tools the Detect_Drift toolchain (Kubernetes client, kubectl,
+    minikube) is installed.
+    """
+    if tools is None:
+        packages, blocks, manual = DEFAULT_SETUP_PACKAGES, DEFAULT_SETUP_BLOCKS, []
+    else:
+        packages, blocks, manual = [], [], []
+        for tool in tools:
+            entry = TOOL_SETUP.get(tool.strip().lower())
+            if entry is None:
+                manual.append(tool.strip())
+                continue
+            packages.extend(p for p in entry[0] if p not in packages)
+            blocks.extend(b for b in entry[1] if b not in blocks)
+    
+    sections = []
+    if packages:
+        sections.append(f"# Install required packages\npip install {' '.join(packages)}\n")
+    sections.extend(blocks)
+    if manual:
+        sections.append("# Install manually\n" + "".join(f"# - {tool}\n" for tool in manual))
+    return "\n".join(sections)
+
+RESOURCES_README_TEMPLATE = """\
+# Project Resources
+
+This directory contains reference materials, sample configurations, and documentation for the {title} project.
+
+## Contents
+
+{contents}"""
+
+DAY_TEMPLATE = """\
+# Week {week} Day {day}: {title}
+
+## Overview
+
+- **Duration**: Full day (8 hours)
+- **Why This Matters**: {why_this_matters}
+- **Connection to Project**: {connection_to_project}
+
+## Learning Objectives
+
+By the end of today, you will be able to:
+{learning_objectives}
+## Prerequisites
+
+{prerequisites}
+## Morning Session (4 hours)
+
+### Technical Concept Deep Dive (90 minutes)
+
+#### Key Concept 1: [Title]
+- [Detailed explanation]
+- [Code example or configuration sample]
+- [Common misconceptions]
+
+#### Key Concept 2: [Title]
+- [Detailed explanation]
+- [Code example or configuration sample]
+- [Common misconceptions]
+
+#### Key Concept 3: [Title]
+- [Detailed explanation]
+- [Code example or configuration sample]
+- [Common misconceptions]
+
+#### Self-Check Questions
+- [Question 1]
+- [Question 2]
+- [Question 3]
+
+### Hands-on Exploration (2.5 hours)
+
+#### Setup (30 minutes)
+```bash
+# Environment setup commands
+[detailed commands with explanations]
+```
+
+#### Exercise 1: [Title] (45 minutes)
+1. [Step-by-step instructions]
+2. [Expected outputs]
+3. [Verification steps]
+
+#### Exercise 2: [Title] (45 minutes)
+1. [Step-by-step instructions]
+2. [Expected outputs]
+3. [Verification steps]
+
+#### Exercise 3: [Title] (30 minutes)
+1. [Step-by-step instructions]
+2. [Expected outputs]
+3. [Verification steps]
+
+## Afternoon Session (4 hours)
+
+### Implementation Challenge (3 hours)
+
+#### Task Description
+[Detailed description of the challenge that applies morning concepts]
+
+#### Requirements
+- [Specific requirement 1]
+- [Specific requirement 2]
+- [Specific requirement 3]
+
+#### Implementation Steps
+1. [Detailed step with technical guidance]
+2. [Detailed step with technical guidance]
+3. [Detailed step with technical guidance]
+
+#### Expected Deliverables
+- [Specific output 1]
+- [Specific output 2]
+- [Specific output 3]
+
+#### Testing and Validation
+- [How to verify your implementation works correctly]
+- [Test cases to run]
+- [Common errors and solutions]
+
+### Documentation and Reflection (1 hour)
+
+#### Documentation Tasks
+- Update your project journal with today's learnings
+- Document your implementation with:
+  - Architecture diagrams
+  - Code comments
+  - README updates
+  - Decision log entries
+
+#### Reflection Questions
+- What was the most challenging concept today and why?
+- How does today's work connect to real-world DevOps scenarios?
+- What would you change about your implementation if you had more time?
+- What questions do you still have about today's topics?
+
+## Resources
+
+### Essential Reading
+- [Resource 1 with specific chapters/sections]
+- [Resource 2 with specific chapters/sections]
+- [Resource 3 with specific chapters/sections]
+
+### Reference Documentation
+- [Link to official documentation with specific sections]
+- [Link to official documentation with specific sections]
+- [Link to official documentation with specific sections]
+
+### Video Tutorials
+- [Video 1 with timestamp references]
+- [Video 2 with timestamp references]
+- [Video 3 with timestamp references]
+
+### Code Examples
+- [GitHub repository or Gist link with specific files]
+- [GitHub repository or Gist link with specific files]
+- [GitHub repository or Gist link with specific files]
+
+## Troubleshooting Guide
+
+| Issue | Symptoms | Solution |
+|-------|----------|----------|
+| [Common Issue 1] | [How to identify] | [Step-by-step resolution] |
+| [Common Issue 2] | [How to identify] | [Step-by-step resolution] |
+| [Common Issue 3] | [How to identify] | [Step-by-step resolution] |
+| [Common Issue 4] | [How to identify] | [Step-by-step resolution] |
+| [Common Issue 5] | [How to identify] | [Step-by-step resolution] |
+
+## Mentorship and Support
+
+### Scheduled Check-ins
+- Morning kickoff (9:00 AM): Review plan and clarify questions
+- Midday check (12:30 PM): Verify morning exercises completion
+- End-of-day review (4:30 PM): Evaluate deliverables and answer questions
+
+### When to Ask for Help
+- You've been stuck on the same issue for more than 30 minutes
+- Your implementation is producing unexpected results that you can't debug
+- You've consulted all the resources but still have conceptual questions
+
+### How to Ask for Help Effectively
+- Clearly describe what you're trying to achieve
+- Explain what you've tried already
+- Share relevant code or configurations
+- Specify error messages you're receiving
+
+## Extension Activities
+
+If you complete the day's tasks early, challenge yourself with:
+- [Advanced extension 1]
+- [Advanced extension 2]
+- [Advanced extension 3]
+
+## Preparation for Tomorrow
+
+To prepare for tomorrow's tasks:
+- Review [specific resources]
+- Think about [concepts to consider]
+- Ensure [environment preparations]
+
+## Success Criteria
+
+You have successfully completed today's tasks when:
+- [Specific, measurable outcome 1]
+- [Specific, measurable outcome 2]
+- [Specific, measurable outcome 3]
+- Your documentation clearly explains your implementation
+- You can answer the self-check questions confidently
+"""
+
+@functools.lru_cache(maxsize=None)
+def compile_template(template):
+    """
+    Split a template into static byte chunks and dynamic slots.
+    
+    Args:
+        template: Template text using {slot} placeholders
+    
+    Returns:
+        A tuple of (static_bytes, slot_name) pairs; slot_name is None for the
+        trailing static chunk
+    """
+    return tuple((literal.encode(), field) for literal, field, _, _ in string.Formatter().parse(template))
+
+def render_template(template, **slots):
+    """Render a template to bytes, formatting list values as bullet lists"""
+    chunks = []
+    for static, slot in compile_template(template):
+        chunks.append(static)
+        if slot is not None:
+            value = slots[slot]
+            if isinstance(value, (list, tuple)):
+                chunks.append("".join(f"- {item}\n" for item in value).encode())
+            else:
+                chunks.append(str(value).encode())
+    return b"".join(chunks)
+
+TRACE_ENV = "GENERATE_PROJECT_TRACE"
+TRACE_FILE_ENV = "GENERATE_PROJECT_TRACE_FILE"
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class NullTracer:
+    """Tracer used when instrumentation is off; span() costs one method call"""
+    enabled = False
+    
+    def span(self, name):
+        return _NULL_SPAN
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+    
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+class Tracer:
+    """
+    Collect per-phase counters and latency histograms, and optionally
+    Chrome trace events.
+    
+    Histogram bucket b counts spans that took less than 2**b microseconds
+    (and at least 2**(b-1)).
+    """
+    enabled = True
+    
+    def __init__(self, record_events=False):
+        self.stats = {}
+        self.events = [] if record_events else None
+        self._lock = threading.Lock()
+    
+    def span(self, name):
+        return _Span(self, name)
+    
+    def record(self, name, start_ns, duration_ns):
+        bucket = (duration_ns // 1000).bit_length()
+        with self._lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = {"count": 0, "total_ns": 0, "max_ns": 0, "histogram": {}}
+            entry["count"] += 1
+            entry["total_ns"] += duration_ns
+            entry["max_ns"] = max(entry["max_ns"], duration_ns)
+            entry["histogram"][bucket] = entry["histogram"].get(bucket, 0) + 1
+        if self.events is not None:
+            self.events.append({"name": name, "cat": "generate", "ph": "X", "ts": start_ns / 1000,
+                                "dur": duration_ns / 1000, "pid": os.getpid(), "tid": threading.get_ident()})
+    
+    def snapshot(self):
+        """Return the collected data in a picklable form (for worker processes)"""
+        return {"stats": self.stats, "events": self.events}
+    
+    def merge(self, snapshot):
+        """Fold in the data returned by another tracer's snapshot()"""
+        for name, other in snapshot["stats"].items():
+            entry = self.stats.setdefault(name, {"count": 0, "total_ns": 0, "max_ns": 0, "histogram": {}})
+            entry["count"] += other["count"]
+            entry["total_ns"] += other["total_ns"]
+            entry["max_ns"] = max(entry["max_ns"], other["max_ns"])
+            for bucket, count in other["histogram"].items():
+                entry["histogram"][bucket] = entry["histogram"].get(bucket, 0) + count
+        if self.events is not None and snapshot["events"]:
+            self.events.extend(snapshot["events"])
+    
+    def report(self, file=sys.stderr):
+        """Print per-phase counters and latency histograms"""
+        print(f"{'phase':<20} {'count':>8} {'total ms':>10} {'mean µs':>9} {'max µs':>9}  histogram (<µs:count)", file=file)
+        for name, entry in sorted(self.stats.items(), key=lambda item: -item[1]["total_ns"]):
+            histogram = " ".join(f"{1 << bucket}:{count}" for bucket, count in sorted(entry["histogram"].items()))
+            print(f"{name:<20} {entry['count']:>8} {entry['total_ns'] / 1e6:>10.2f} "
+                  f"{entry['total_ns'] / entry['count'] / 1000:>9.1f} {entry['max_ns'] / 1000:>9.1f}  {histogram}", file=file)
+    
+    def write_chrome_trace(self, path):
+        """Write the recorded events as Chrome trace-event JSON (chrome://tracing, Perfetto)"""
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": self.events or [], "displayTimeUnit": "ms"}, f)
+
+def configure_tracing(enabled=False, record_events=False):
+    """
+    Switch instrumentation on or off for this process.
+    
+    Args:
+        enabled: Collect per-phase counters and histograms
+        record_events: Also keep individual events for a Chrome trace
+            (implies enabled)
+    
+    Returns:
+        The new process-wide tracer
+    """
+    global TRACER
+    if enabled or record_events:
+        TRACER = Tracer(record_events)
+    else:
+        TRACER = NullTracer()
+    return TRACER
+
+TRACER = NullTracer()
+configure_tracing(os.environ.get(TRACE_ENV, "") not in ("", "0"), bool(os.environ.get(TRACE_FILE_ENV)))
+
+MANIFEST_NAME = ".scaffold-manifest.json"
+
+class Schedule:
+    """
+    Shape of an internship programme: number of weeks and working days per week.
+    
+    overrides maps a project title (or its directory name) to a dict with
+    "weeks" and/or "days_per_week" replacing the defaults for that project.
+    """
+    
+    def __init__(self, weeks=24, days_per_week=5, overrides=None):
+        if weeks < 1:
+            raise ValueError(f"A schedule needs at least one week, got {weeks}")
+        if not 1 <= days_per_week <= 7:
+            raise ValueError(f"days_per_week must be between 1 and 7, got {days_per_week}")
+        self.weeks = weeks
+        self.days_per_week = days_per_week
+        self.overrides = overrides or {}
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a schedule from {"weeks": ..., "days_per_week": ..., "overrides": {...}}"""
+        return cls(data.get("weeks", 24), data.get("days_per_week", 5), data.get("overrides"))
+    
+    def for_project(self, project_title):
+        """Return the schedule that applies to a project"""
+        override = self.overrides.get(project_title) or self.overrides.get(project_slug(project_title))
+        if not override:
+            return self
+        return Schedule(override.get("weeks", self.weeks), override.get("days_per_week", self.days_per_week))
+    
+    def __repr__(self):
+        return f"Schedule(weeks={self.weeks}, days_per_week={self.days_per_week}, overrides={self.overrides!r})"
+
+DEFAULT_SCHEDULE = Schedule()
+
+def load_schedule(path):
+    """Read the "schedule" object of a JSON manifest, or None if it has none"""
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "schedule" in data:
+        return Schedule.from_dict(data["schedule"])
+    return None
+
+def iter_project_files(project_title, description=None, schedule=None, tools=None, only=None):
+    """
+    Lazily yield the (relative_path, content, mode) items of a project tree.
+    
+    Directories are yielded before their contents with content set to None.
+    File content is rendered bytes; mode is None unless the file needs
+    specific permission bits. Only one item is rendered at a time, so the
+    schedule size does not affect memory use.
     
     Args:
         project_title: The title of the project
+        description: Problem statement for the main README
+        schedule: Schedule to generate (defaults to 24 weeks of 5 days);
+            per-project overrides are applied here
+        tools: Tool names installed by setup/setup.sh (defaults to the
+            Detect_Drift toolchain)
+        only: Collection of relative file paths to render; when given, all
+            other files and every directory are skipped without rendering
+    """
+    schedule = (schedule or DEFAULT_SCHEDULE).for_project(project_title)
+    days = range(1, schedule.days_per_week + 1)
+    catalog = load_catalog(find_catalog(project_title))
+    
+    def wanted(path):
+        return only is None or path in only
+    
+    if only is None:
+        yield "setup", None, None
+        yield "resources", None, None
+    
+    if wanted("README.md"):
+        yield "README.md", render_template(PROJECT_README_TEMPLATE, title=project_title, description=description or DEFAULT_PROBLEM_STATEMENT, weeks=schedule.weeks), None
+    if wanted("setup/README.md"):
+        yield "setup/README.md", render_template(SETUP_README_TEMPLATE, title=project_title), None
+    if wanted("setup/setup.sh"):
+        yield "setup/setup.sh", render_template(SETUP_SCRIPT_TEMPLATE, title=project_title, install=render_setup_commands(tools)), 0o755
+    if wanted("resources/README.md"):
+        yield "resources/README.md", render_template(RESOURCES_README_TEMPLATE, title=project_title,
+                                                     contents=get_resources(catalog, project_title)), None
+    
+    if only is None:
+        yield "resources/sample_configs", None, None
+        yield "resources/cheat_sheets", None, None
+        yield "resources/case_studies", None, None
+        yield "weekly_tasks", None, None
+    
+    # Weekly directories and files
+    for week in range(1, schedule.weeks + 1):
+        week_dir = f"weekly_tasks/week-{week}"
+        if only is None:
+            yield week_dir, None, None
+        elif not any(path.startswith(f"{week_dir}/") for path in only):
+            continue
+        
+        with TRACER.span("lookup.week"):
+            day_titles = {day: get_day_title(week, day, catalog, project_title) for day in days}
+            theme = get_week_theme(week, catalog, project_title)
+            objectives = get_week_objectives(week, catalog, project_title)
+        if wanted(f"{week_dir}/README.md"):
+            with TRACER.span("render.week_readme"):
+                data = render_template(
+                    WEEK_README_TEMPLATE,
+                    week=week,
+                    theme=theme,
+                    objectives=objectives,
+                    daily_tasks=[f"[Day {day}: {title}](day-{day}.md)" for day, title in day_titles.items()])
+            yield f"{week_dir}/README.md", data, None
+        
+        for day, day_title in day_titles.items():
+            if not wanted(f"{week_dir}/day-{day}.md"):
+                continue
+            with TRACER.span("lookup.day"):
+                slots = {
+                    "why_this_matters": get_why_this_matters(week, day, catalog, project_title),
+                    "connection_to_project": get_connection_to_project(week, day, catalog, project_title),
+                    "learning_objectives": get_learning_objectives(week, day, catalog, project_title),
+                    "prerequisites": get_prerequisites(week, day, catalog, project_title),
+                }
+            with TRACER.span("render.day"):
+                data = render_template(DAY_TEMPLATE, week=week, day=day, title=day_title, **slots)
+            yield f"{week_dir}/day-{day}.md", data, None
+
+def _read_manifest(base_dir):
+    """Return the {relative_path: sha256} map recorded by the last run"""
+    try:
+        with open(os.path.join(base_dir, MANIFEST_NAME)) as f:
+            return json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+
+def _file_digest(path):
+    """Return the sha256 of a file on disk, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+class OutputSink:
+    """
+    Destination that generated entries are written through.
+    
+    Paths are relative to the sink and use "/" as separator. Sinks can be
+    used as context managers; close() returns a dict of counters. When the
+    with block raises, abort() is called instead of close(), so a failed
+    run is never recorded as complete.
     """
-    # Create base directories
-    base_dir = project_title.lower().replace(' ', '-').replace('_', '-')
-    os.makedirs(base_dir, exist_ok=True)
-    os.makedirs(f"{base_dir}/setup", exist_ok=True)
-    os.makedirs(f"{base_dir}/resources", exist_ok=True)
-    
-    # Create main README
-    with open(f"{base_dir}/README.md", 'w') as f:
-        f.write(f"# {project_title}\n\n")
-        f.write(f"## Problem Statement\n\n")
-        f.write("Configuration drift occurs when the actual state of infrastructure (particularly Kubernetes clusters) diverges from the desired state defined in Git repositories. This project aims to develop a comprehensive tool to detect, report, and remediate drift across multiple clusters and environments.\n\n")
-        f.write("## Project Structure\n\n")
-        f.write("This repository contains a 24-week DevOps/SRE internship project broken down into daily tasks.\n\n")
-        f.write("### Getting Started\n\n")
-        f.write("1. Start with the Week 1, Day 1 tasks\n")
-        f.write("2. Follow the day-by-day progression\n")
-        f.write("3. Complete the daily reflections\n")
-        f.write("4. Reach out to mentors as needed\n\n")
-        f.write("### Repository Structure\n\n")
-        f.write("- `/setup`: Environment setup scripts and guides\n")
-        f.write("- `/resources`: Reference materials and documentation\n")
-        f.write("- `/weekly_tasks`: Daily task breakdowns organized by week\n")
-    
-    # Create setup files
-    with open(f"{base_dir}/setup/README.md", 'w') as f:
-        f.write("# Environment Setup\n\n")
-        f.write("This directory contains scripts and guides to set up your development environment for the Detect_Drift project.\n\n")
-        f.write("## Requirements\n\n")
-        f.write("- Computer with at least 8GB RAM, 4 CPU cores\n")
-        f.write("- 20GB free disk space\n")
-        f.write("- Git installed\n")
-        f.write("- Docker installed\n")
-        f.write("- Python 3.8+ installed\n\n")
-        f.write("## Setup Script\n\n")
-        f.write("Run the following command to set up your environment:\n\n")
-        f.write("```bash\n")
-        f.write("./setup.sh\n")
-        f.write("```\n")
-    
-    with open(f"{base_dir}/setup/setup.sh", 'w') as f:
-        f.write("#!/bin/bash\n\n")
-        f.write("# Detect_Drift Project Setup Script\n\n")
-        f.write("# Install required packages\n")
-        f.write("pip install kubernetes pyyaml requests rich\n\n")
-        f.write("# Install kubectl\n")
-        f.write("curl -LO \"https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/amd64/kubectl\"\n")
-        f.write("chmod +x kubectl\n")
-        f.write("sudo mv kubectl /usr/local/bin/\n\n")
-        f.write("# Install minikube\n")
-        f.write("curl -LO https://storage.googleapis.com/minikube/releases/latest/minikube-linux-amd64\n")
-        f.write("chmod +x minikube-linux-amd64\n")
-        f.write("sudo mv minikube-linux-amd64 /usr/local/bin/minikube\n\n")
-        f.write("# Start minikube\n")
-        f.write("minikube start\n\n")
-        f.write("echo \"Setup completed successfully!\"\n")
-    os.chmod(f"{base_dir}/setup/setup.sh", 0o755)
-    
-    # Create resources directory
-    with open(f"{base_dir}/resources/README.md", 'w') as f:
-        f.write("# Project Resources\n\n")
-        f.write("This directory contains reference materials, sample configurations, and documentation for the Detect_Drift project.\n\n")
-        f.write("## Contents\n\n")
-        f.write("- `sample_configs/`: Example Kubernetes manifests for testing\n")
-        f.write("- `cheat_sheets/`: Quick reference guides for tools and concepts\n")
-        f.write("- `case_studies/`: Real-world examples of configuration drift\n")
-    
-    os.makedirs(f"{base_dir}/resources/sample_configs", exist_ok=True)
-    os.makedirs(f"{base_dir}/resources/cheat_sheets", exist_ok=True)
-    os.makedirs(f"{base_dir}/resources/case_studies", exist_ok=True)
-    
-    # Create weekly directories and files
-    for week in range(1, 25):
-        week_dir = f"{base_dir}/weekly_tasks/week-{week}"
-        os.makedirs(week_dir, exist_ok=True)
+    
+    def makedirs(self, path):
+        raise NotImplementedError
+    
+    def write(self, path, data, mode=None):
+        raise NotImplementedError
+    
+    def close(self):
+        return {}
+    
+    def abort(self):
+        """Release resources after a failed run without finalising the output"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+class ForwardingSink(OutputSink):
+    """Pass every entry on to another sink; subclasses observe or change entries on the way"""
+    
+    def __init__(self, inner):
+        self.inner = inner
+    
+    def makedirs(self, path):
+        self.inner.makedirs(path)
+    
+    def write(self, path, data, mode=None):
+        self.inner.write(path, data, mode)
+    
+    def close(self):
+        return self.inner.close()
+    
+    def abort(self):
+        self.inner.abort()
+
+DURABILITY_MODES = ("none", "file", "directory")
+
+class WriteError(Exception):
+    """Raised when one or more files could not be written; failures holds (path, exception) pairs"""
+    
+    def __init__(self, failures):
+        self.failures = failures
+        details = "\n".join(f"  {path}: {error}" for path, error in failures)
+        super().__init__(f"{len(failures)} file(s) could not be written:\n{details}")
+
+class FileSystemSink(OutputSink):
+    """
+    Write entries below a directory on disk.
+    
+    In incremental mode every top-level directory (one per project) gets a
+    content-hash manifest, and a file is only written when its content
+    differs from the hash recorded there (or, for files the manifest does
+    not know about, from the file on disk). A full write leaves no manifest
+    in the tree and removes a stale one, since the hashes it holds no
+    longer describe the files.
+    
+    durability is one of DURABILITY_MODES: "none" leaves flushing to the OS,
+    "file" fsyncs every file before closing it, and "directory" fsyncs the
+    written files and then each directory that received them in one batch,
+    when the sink is closed.
+    
+    Failed writes do not stop the run: they are left out of the manifest (so
+    the next incremental run retries them) and reported together by close(),
+    which raises WriteError.
+    
+    A partial sink receives only some files of each project (see
+    iter_project_files' only argument): manifest entries of the files it
+    was not given are kept instead of being treated as orphans.
+    """
+    
+    def __init__(self, root=".", incremental=False, durability="none", partial=False):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+        self.root = root
+        self.incremental = incremental
+        self.durability = durability
+        self.partial = partial
+        self.counts = {"directories": 0, "created": 0, "updated": 0, "unchanged": 0, "orphaned": 0}
+        self._manifests = {}
+        self._dirty_files = set()
+        self._dirty_dirs = set()
+        self._failures = []
+    
+    def _manifest_for(self, path):
+        """Return (old_manifest, new_manifest, path_in_project) for path"""
+        top, sep, rel_path = path.partition("/")
+        if not sep:
+            top, rel_path = "", path
+        if top not in self._manifests:
+            old = _read_manifest(os.path.join(self.root, top)) if self.incremental or self.partial else {}
+            self._manifests[top] = (old, dict(old) if self.partial else {})
+        old, new = self._manifests[top]
+        return old, new, rel_path
+    
+    def makedirs(self, path):
+        with TRACER.span("fs.makedirs"):
+            os.makedirs(os.path.join(self.root, path), exist_ok=True)
+        self.counts["directories"] += 1
+    
+    def write(self, path, data, mode=None):
+        old_manifest, manifest, rel_path = self._manifest_for(path)
+        full_path = os.path.join(self.root, path)
+        digest = hashlib.sha256(data).hexdigest()
+        exists = os.path.isfile(full_path)
+        if self.incremental and exists:
+            recorded = old_manifest.get(rel_path) or _file_digest(full_path)
+            if recorded == digest:
+                if mode is not None and os.stat(full_path).st_mode & 0o777 != mode:
+                    with TRACER.span("fs.chmod"):
+                        os.chmod(full_path, mode)
+                manifest[rel_path] = digest
+                self.counts["unchanged"] += 1
+                return
         
-        # Create weekly README
-        with open(f"{week_dir}/README.md", 'w') as f:
-            f.write(f"# Week {week}: {get_week_theme(week)}\n\n")
-            f.write("## Weekly Objectives\n\n")
-            for objective in get_week_objectives(week):
-                f.write(f"- {objective}\n")
-            f.write("\n## Daily Tasks\n\n")
-            for day in range(1, 6):
-                day_title = get_day_title(week, day)
-                f.write(f"- [Day {day}: {day_title}](day-{day}.md)\n")
+        if self.durability == "directory":
+            self._dirty_dirs.add(os.path.dirname(full_path))
+        # Only a stored file is recorded, so a failed write is retried by the next incremental run
+        manifest.pop(rel_path, None)
+        try:
+            self._store(path, full_path, data, mode)
+        except OSError as e:
+            self._failures.append((path, e))
+            return
+        manifest[rel_path] = digest
+        self.counts["updated" if exists else "created"] += 1
+    
+    def _store(self, path, full_path, data, mode):
+        """Write one file to disk; subclasses may run this off the caller's thread"""
+        with TRACER.span("fs.write"):
+            with open(full_path, 'wb') as f:
+                f.write(data)
+                if self.durability == "file":
+                    f.flush()
+                    os.fsync(f.fileno())
+        if mode is not None:
+            with TRACER.span("fs.chmod"):
+                os.chmod(full_path, mode)
+        if self.durability == "directory":
+            self._dirty_files.add(full_path)
+    
+    def _sync_paths(self):
+        """
+        fsync the written files, then their directories, so no directory
+        entry outlives the data it points to.
         
-        # Create daily files
-        for day in range(1, 6):
-            day_title = get_day_title(week, day)
-            with open(f"{week_dir}/day-{day}.md", 'w') as f:
-                f.write(f"# Week {week} Day {day}: {day_title}\n\n")
-                f.write("## Overview\n\n")
-                f.write("- **Duration**: Full day (8 hours)\n")
-                f.write(f"- **Why This Matters**: {get_why_this_matters(week, day)}\n")
-                f.write(f"- **Connection to Project**: {get_connection_to_project(week, day)}\n\n")
-                f.write("## Learning Objectives\n\n")
-                f.write("By the end of today, you will be able to:\n")
-                for objective in get_learning_objectives(week, day):
-                    f.write(f"- {objective}\n")
-                f.write("\n## Prerequisites\n\n")
-                for prereq in get_prerequisites(week, day):
-                    f.write(f"- {prereq}\n")
-                
-                # Add the rest of the sections as placeholders
-                f.write("\n## Morning Session (4 hours)\n\n")
-                f.write("### Technical Concept Deep Dive (90 minutes)\n\n")
-                f.write("#### Key Concept 1: [Title]\n")
-                f.write("- [Detailed explanation]\n")
-                f.write("- [Code example or configuration sample]\n")
-                f.write("- [Common misconceptions]\n\n")
-                
-                f.write("#### Key Concept 2: [Title]\n")
-                f.write("- [Detailed explanation]\n")
-                f.write("- [Code example or configuration sample]\n")
-                f.write("- [Common misconceptions]\n\n")
-                
-                f.write("#### Key Concept 3: [Title]\n")
-                f.write("- [Detailed explanation]\n")
-                f.write("- [Code example or configuration sample]\n")
-                f.write("- [Common misconceptions]\n\n")
-                
-                f.write("#### Self-Check Questions\n")
-                f.write("- [Question 1]\n")
-                f.write("- [Question 2]\n")
-                f.write("- [Question 3]\n\n")
-                
-                f.write("### Hands-on Exploration (2.5 hours)\n\n")
-                f.write("#### Setup (30 minutes)\n")
-                f.write("```bash\n")
-                f.write("# Environment setup commands\n")
-                f.write("[detailed commands with explanations]\n")
-                f.write("```\n\n")
-                
-                f.write("#### Exercise 1: [Title] (45 minutes)\n")
-                f.write("1. [Step-by-step instructions]\n")
-                f.write("2. [Expected outputs]\n")
-                f.write("3. [Verification steps]\n\n")
-                
-                f.write("#### Exercise 2: [Title] (45 minutes)\n")
-                f.write("1. [Step-by-step instructions]\n")
-                f.write("2. [Expected outputs]\n")
-                f.write("3. [Verification steps]\n\n")
-                
-                f.write("#### Exercise 3: [Title] (30 minutes)\n")
-                f.write("1. [Step-by-step instructions]\n")
-                f.write("2. [Expected outputs]\n")
-                f.write("3. [Verification steps]\n\n")
-                
-                f.write("## Afternoon Session (4 hours)\n\n")
-                f.write("### Implementation Challenge (3 hours)\n\n")
-                f.write("#### Task Description\n")
-                f.write("[Detailed description of the challenge that applies morning concepts]\n\n")
-                
-                f.write("#### Requirements\n")
-                f.write("- [Specific requirement 1]\n")
-                f.write("- [Specific requirement 2]\n")
-                f.write("- [Specific requirement 3]\n\n")
-                
-                f.write("#### Implementation Steps\n")
-                f.write("1. [Detailed step with technical guidance]\n")
-                f.write("2. [Detailed step with technical guidance]\n")
-                f.write("3. [Detailed step with technical guidance]\n\n")
-                
-                f.write("#### Expected Deliverables\n")
-                f.write("- [Specific output 1]\n")
-                f.write("- [Specific output 2]\n")
-                f.write("- [Specific output 3]\n\n")
-                
-                f.write("#### Testing and Validation\n")
-                f.write("- [How to verify your implementation works correctly]\n")
-                f.write("- [Test cases to run]\n")
-                f.write("- [Common errors and solutions]\n\n")
-                
-                f.write("### Documentation and Reflection (1 hour)\n\n")
-                f.write("#### Documentation Tasks\n")
-                f.write("- Update your project journal with today's learnings\n")
-                f.write("- Document your implementation with:\n")
-                f.write("  - Architecture diagrams\n")
-                f.write("  - Code comments\n")
-                f.write("  - README updates\n")
-                f.write("  - Decision log entries\n\n")
-                
-                f.write("#### Reflection Questions\n")
-                f.write("- What was the most challenging concept today and why?\n")
-                f.write("- How does today's work connect to real-world DevOps scenarios?\n")
-                f.write("- What would you change about your implementation if you had more time?\n")
-                f.write("- What questions do you still have about today's topics?\n\n")
-                
-                f.write("## Resources\n\n")
-                f.write("### Essential Reading\n")
-                f.write("- [Resource 1 with specific chapters/sections]\n")
-                f.write("- [Resource 2 with specific chapters/sections]\n")
-                f.write("- [Resource 3 with specific chapters/sections]\n\n")
-                
-                f.write("### Reference Documentation\n")
-                f.write("- [Link to official documentation with specific sections]\n")
-                f.write("- [Link to official documentation with specific sections]\n")
-                f.write("- [Link to official documentation with specific sections]\n\n")
-                
-                f.write("### Video Tutorials\n")
-                f.write("- [Video 1 with timestamp references]\n")
-                f.write("- [Video 2 with timestamp references]\n")
-                f.write("- [Video 3 with timestamp references]\n\n")
-                
-                f.write("### Code Examples\n")
-                f.write("- [GitHub repository or Gist link with specific files]\n")
-                f.write("- [GitHub repository or Gist link with specific files]\n")
-                f.write("- [GitHub repository or Gist link with specific files]\n\n")
-                
-                f.write("## Troubleshooting Guide\n\n")
-                f.write("| Issue | Symptoms | Solution |\n")
-                f.write("|-------|----------|----------|\n")
-                f.write("| [Common Issue 1] | [How to identify] | [Step-by-step resolution] |\n")
-                f.write("| [Common Issue 2] | [How to identify] | [Step-by-step resolution] |\n")
-                f.write("| [Common Issue 3] | [How to identify] | [Step-by-step resolution] |\n")
-                f.write("| [Common Issue 4] | [How to identify] | [Step-by-step resolution] |\n")
-                f.write("| [Common Issue 5] | [How to identify] | [Step-by-step resolution] |\n\n")
-                
-                f.write("## Mentorship and Support\n\n")
-                f.write("### Scheduled Check-ins\n")
-                f.write("- Morning kickoff (9:00 AM): Review plan and clarify questions\n")
-                f.write("- Midday check (12:30 PM): Verify morning exercises completion\n")
-                f.write("- End-of-day review (4:30 PM): Evaluate deliverables and answer questions\n\n")
-                
-                f.write("### When to Ask for Help\n")
-                f.write("- You've been stuck on the same issue for more than 30 minutes\n")
-                f.write("- Your implementation is producing unexpected results that you can't debug\n")
-                f.write("- You've consulted all the resources but still have conceptual questions\n\n")
-                
-                f.write("### How to Ask for Help Effectively\n")
-                f.write("- Clearly describe what you're trying to achieve\n")
-                f.write("- Explain what you've tried already\n")
-                f.write("- Share relevant code or configurations\n")
-                f.write("- Specify error messages you're receiving\n\n")
-                
-                f.write("## Extension Activities\n\n")
-                f.write("If you complete the day's tasks early, challenge yourself with:\n")
-                f.write("- [Advanced extension 1]\n")
-                f.write("- [Advanced extension 2]\n")
-                f.write("- [Advanced extension 3]\n\n")
-                
-                f.write("## Preparation for Tomorrow\n\n")
-                f.write("To prepare for tomorrow's tasks:\n")
-                f.write("- Review [specific resources]\n")
-                f.write("- Think about [concepts to consider]\n")
-                f.write("- Ensure [environment preparations]\n\n")
-                
-                f.write("## Success Criteria\n\n")
-                f.write("You have successfully completed today's tasks when:\n")
-                f.write("- [Specific, measurable outcome 1]\n")
-                f.write("- [Specific, measurable outcome 2]\n")
-                f.write("- [Specific, measurable outcome 3]\n")
-                f.write("- Your documentation clearly explains your implementation\n")
-                f.write("- You can answer the self-check questions confidently\n")
+        File failures join the write failures; directory failures are
+        returned, as there is no manifest entry to drop for them.
+        """
+        directory_failures = []
+        for span, paths, failures in (("fs.fsync", self._dirty_files, self._failures),
+                                      ("fs.fsync_dir", self._dirty_dirs, directory_failures)):
+            for path in sorted(paths):
+                with TRACER.span(span):
+                    try:
+                        fd = os.open(path or ".", os.O_RDONLY)
+                        try:
+                            os.fsync(fd)
+                        finally:
+                            os.close(fd)
+                    except OSError as e:
+                        failures.append((os.path.relpath(path or ".", self.root), e))
+        self._dirty_files = set()
+        self._dirty_dirs = set()
+        return directory_failures
+    
+    def close(self):
+        directory_failures = self._sync_paths() if self.durability == "directory" else []
+        for path, _ in self._failures:
+            _, manifest, rel_path = self._manifest_for(path)
+            manifest.pop(rel_path, None)
+        failures = sorted(self._failures + directory_failures, key=lambda failure: failure[0])
+        self._failures = []
+        self.counts["failed"] = len(failures)
+        for top, (old_manifest, manifest) in self._manifests.items():
+            manifest_path = os.path.join(self.root, top, MANIFEST_NAME)
+            if not (self.incremental or self.partial):
+                try:
+                    os.remove(manifest_path)
+                except FileNotFoundError:
+                    pass
+                continue
+            self.counts["orphaned"] += len(old_manifest.keys() - manifest.keys())
+            if manifest != old_manifest:
+                with open(manifest_path, 'w') as f:
+                    json.dump({"files": manifest}, f, indent=1, sort_keys=True)
+        self._manifests = {}
+        if failures:
+            raise WriteError(failures)
+        return dict(self.counts)
+    
+    def abort(self):
+        # Keep the previous manifests; files this run rewrote no longer match them and are rewritten next time
+        self._manifests = {}
+        self._dirty_files = set()
+        self._dirty_dirs = set()
+        self._failures = []
+
+class ThreadedFileSystemSink(FileSystemSink):
+    """
+    FileSystemSink that hands file writes to a bounded thread pool.
+    
+    Rendering, hashing and directory creation stay on the caller's thread,
+    so directories always exist before their files are submitted. At most
+    max_workers * 4 writes are in flight at a time, and their failures are
+    reported by close() as for the serial sink. This hides per-file
+    round-trips on network and FUSE filesystems.
+    """
+    
+    def __init__(self, root=".", incremental=False, durability="none", max_workers=8):
+        super().__init__(root, incremental, durability)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scaffold-writer")
+        self._slots = threading.BoundedSemaphore(max_workers * 4)
+        self._failures_lock = threading.Lock()
+    
+    def _store(self, path, full_path, data, mode):
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(super()._store, path, full_path, data, mode)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda done: self._finished(path, done))
+    
+    def _finished(self, path, future):
+        self._slots.release()
+        error = future.exception()
+        if error is not None:
+            with self._failures_lock:
+                self._failures.append((path, error))
+    
+    def close(self):
+        self._pool.shutdown(wait=True)
+        return super().close()
+    
+    def abort(self):
+        self._pool.shutdown(wait=True)
+        super().abort()
+
+class MemorySink(OutputSink):
+    """Keep entries in memory: files maps path to bytes, modes holds explicit modes"""
+    
+    def __init__(self):
+        self.directories = set()
+        self.files = {}
+        self.modes = {}
+    
+    def makedirs(self, path):
+        self.directories.add(path)
+    
+    def write(self, path, data, mode=None):
+        self.files[path] = data
+        if mode is not None:
+            self.modes[path] = mode
+    
+    def close(self):
+        return {"directories": len(self.directories), "files": len(self.files),
+                "bytes": sum(len(data) for data in self.files.values())}
+
+class DryRunSink(OutputSink):
+    """Record planned (path, size, mode) entries without keeping any content; size is None for directories"""
+    
+    def __init__(self):
+        self.planned = []
+    
+    def makedirs(self, path):
+        self.planned.append((path, None, None))
+    
+    def write(self, path, data, mode=None):
+        self.planned.append((path, len(data), mode))
+    
+    def close(self):
+        sizes = [size for _, size, _ in self.planned if size is not None]
+        return {"directories": len(self.planned) - len(sizes), "files": len(sizes), "bytes": sum(sizes)}
+
+class TarSink(OutputSink):
+    """Stream entries into a gzip-compressed tar on a (possibly non-seekable) binary file object"""
+    
+    def __init__(self, fileobj):
+        self._tar = tarfile.open(fileobj=fileobj, mode="w|gz")
+        self._mtime = time.time()
+        self.count = 0
+    
+    def makedirs(self, path):
+        info = tarfile.TarInfo(path)
+        info.mtime = self._mtime
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        self._tar.addfile(info)
+        self.count += 1
+    
+    def write(self, path, data, mode=None):
+        info = tarfile.TarInfo(path)
+        info.mtime = self._mtime
+        info.size = len(data)
+        info.mode = mode or 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+        self.count += 1
+    
+    def close(self):
+        self._tar.close()
+        return {"entries": self.count}
+
+class ZipSink(OutputSink):
+    """Stream entries into a deflated zip on a (possibly non-seekable) binary file object"""
+    
+    def __init__(self, fileobj):
+        self._zip = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED)
+        self._date_time = time.localtime()[:6]
+        self.count = 0
+    
+    def makedirs(self, path):
+        info = zipfile.ZipInfo(f"{path}/", self._date_time)
+        info.external_attr = (stat.S_IFDIR | 0o755) << 16 | 0x10
+        self._zip.writestr(info, b"")
+        self.count += 1
+    
+    def write(self, path, data, mode=None):
+        info = zipfile.ZipInfo(path, self._date_time)
+        info.external_attr = (stat.S_IFREG | (mode or 0o644)) << 16
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self._zip.writestr(info, data)
+        self.count += 1
+    
+    def close(self):
+        self._zip.close()
+        return {"entries": self.count}
+
+ARCHIVE_SINKS = {"tar.gz": TarSink, "zip": ZipSink}
+ARCHIVE_FORMATS = tuple(ARCHIVE_SINKS)
+
+def write_entries(sink, entries):
+    """Feed (path, data, mode) entries into a sink; data None means a directory"""
+    for path, data, mode in entries:
+        if data is None:
+            sink.makedirs(path)
+        else:
+            sink.write(path, data, mode)
+
+def _iter_prefixed_entries(project_title, description=None, schedule=None, tools=None, only=None):
+    """Yield a project's entries with paths prefixed by its directory"""
+    slug = project_slug(project_title)
+    if only is None:
+        yield slug, None, None
+    for rel_path, data, mode in iter_project_files(project_title, description, schedule, tools, only):
+        yield f"{slug}/{rel_path}", data, mode
+
+def write_archive(specs, fileobj, fmt="tar.gz", schedule=None, answers=None):
+    """
+    Stream the trees of one or more projects into a tar.gz or zip archive.
+    
+    Entries are rendered and written one at a time, so memory use does not
+    grow with the number of projects or weeks. fileobj does not need to be
+    seekable (e.g. sys.stdout.buffer).
+    
+    Args:
+        specs: Project specs ({"title": ..., "description": ...})
+        fileobj: Binary file object the archive is written to
+        fmt: One of ARCHIVE_FORMATS
+        schedule: Schedule shared by all projects
+        answers: prompt_batch.PromptAnswers (see create_project_structure)
+    
+    Returns:
+        The number of archive entries written
+    """
+    if fmt not in ARCHIVE_SINKS:
+        raise ValueError(f"Unsupported archive format: {fmt}")
+    sink = ARCHIVE_SINKS[fmt](fileobj)
+    for spec in specs:
+        create_project_structure(spec["title"], spec.get("description"), sink=sink, schedule=schedule, tools=spec.get("tools"),
+                                 answers=answers)
+    return sink.close()["entries"]
 
+def _wrap_sink(sink, project_title, description, schedule, indexer=None, answers=None):
+    """Layer the optional indexer and answer sinks over sink; answers go outermost so the index sees them"""
+    if indexer:
+        sink = indexer.wrap(sink)
+    if answers:
+        sink = answers.wrap(sink, project_title, description, schedule)
+    return sink
+
+def create_project_structure(project_title, description=None, output_dir=".", incremental=False, sink=None, schedule=None,
+                             writers=0, durability="none", tools=None, indexer=None, answers=None, quiet=False):
+    """
+    Create the full project structure including all markdown files
+    with comprehensive content.
+    
+    Args:
+        project_title: The title of the project
+        description: Problem statement for the main README (defaults to the
+            Detect_Drift problem statement)
+        output_dir: Directory in which the project directory is created
+        incremental: Only rewrite files whose content changed since the last
+            run, as recorded in the project's content-hash manifest
+        sink: OutputSink to write through instead of a FileSystemSink on
+            output_dir. The caller owns it and is responsible for closing it.
+        schedule: Schedule to generate (defaults to 24 weeks of 5 days)
+        writers: Number of writer threads; 0 writes files on the calling thread
+        durability: One of DURABILITY_MODES
+        tools: Tool names installed by setup/setup.sh
+        indexer: search_index.Indexer that records the markdown files for
+            the search index as they are written
+        answers: prompt_batch.PromptAnswers whose cached answers replace
+            the templated day files
+        quiet: Skip the summary lines (used by batch workers, whose caller
+            reports each project on one line)
+    
+    Returns:
+        The path of the project directory (relative to the sink when one
+        is given)
+    """
+    entries = _iter_prefixed_entries(project_title, description, schedule, tools)
+    if sink is not None:
+        write_entries(_wrap_sink(sink, project_title, description, schedule, indexer, answers), entries)
+        return project_slug(project_title)
+    
+    base_dir = os.path.join(output_dir, project_slug(project_title))
+    if writers:
+        sink = ThreadedFileSystemSink(output_dir, incremental, durability, max_workers=writers)
+    else:
+        sink = FileSystemSink(output_dir, incremental, durability)
+    with sink:
+        write_entries(_wrap_sink(sink, project_title, description, schedule, indexer, answers), entries)
+    counts = sink.counts
+    if quiet:
+        return base_dir
+    
+    schedule = (schedule or DEFAULT_SCHEDULE).for_project(project_title)
+    total = counts["created"] + counts["updated"] + counts["unchanged"]
+    days = schedule.weeks * schedule.days_per_week
     print(f"✅ Project structure created successfully in the '{base_dir}' directory")
-    print(f"📂 Total files created: {5 * 24 + 24 + 3} (120 daily tasks, 24 weekly READMEs, and 3 support files)")
+    if incremental:
+        print(f"📂 {counts['created']} created, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['orphaned']} orphaned")
+    else:
+        print(f"📂 Total files created: {total} ({days} daily tasks, {schedule.weeks} weekly READMEs, "
+              f"and {total - days - schedule.weeks} support files) in {counts['directories']} directories")
+    return base_dir
+
+VERIFY_IGNORED = {".git", MANIFEST_NAME}
+
+def build_merkle_tree(files):
+    """
+    Build a Merkle tree from file digests.
+    
+    Each node is {"hash": ..., "children": {name: node}}; file nodes have
+    children set to None. A directory's hash covers the names, types and
+    hashes of everything below it, so two subtrees with the same hash are
+    identical. Like git, the tree only knows directories that hold files.
+    
+    Args:
+        files: Mapping of "/"-separated relative path to content sha256
+    """
+    root = {"hash": None, "children": {}}
+    
+    def directory(path):
+        node = root
+        for name in path.split("/") if path else ():
+            node = node["children"].setdefault(name, {"hash": None, "children": {}})
+        return node
+    
+    for path, digest in files.items():
+        parent, _, name = path.rpartition("/")
+        directory(parent)["children"][name] = {"hash": digest, "children": None}
+    
+    def seal(node):
+        if node["children"] is None:
+            return node["hash"]
+        h = hashlib.sha256()
+        for name in sorted(node["children"]):
+            child = node["children"][name]
+            kind = "f" if child["children"] is None else "d"
+            h.update(f"{kind} {name} {seal(child)}\n".encode())
+        node["hash"] = h.hexdigest()
+        return node["hash"]
+    
+    seal(root)
+    return root
+
+def git_blob_id(data):
+    """Return the id git gives a blob with this content"""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _git_files(root):
+    """
+    Return {relative path: blob id} for the files below root as they are on
+    disk, or None when root is not inside a git work tree.
+    
+    Ids of files that match the index come from the index itself: git
+    tells them apart with its stat cache, so they are never read here.
+    Only modified and untracked files are read and hashed.
+    """
+    def ls_files(*options):
+        result = subprocess.run(["git", "-C", root, "ls-files", "-z", *options], capture_output=True, check=True)
+        return [os.fsdecode(path) for path in result.stdout.split(b"\0") if path]
+    
+    try:
+        staged = ls_files("--stage")
+        changed = ls_files("--modified", "--others")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    files = {}
+    for record in staged:
+        info, _, rel_path = record.partition("\t")
+        files[rel_path] = info.split()[1]
+    for rel_path in changed:
+        try:
+            with open(os.path.join(root, rel_path), 'rb') as f:
+                files[rel_path] = git_blob_id(f.read())
+        except FileNotFoundError:
+            files.pop(rel_path, None)
+    return {rel_path: blob for rel_path, blob in files.items() if VERIFY_IGNORED.isdisjoint(rel_path.split("/"))}
+
+def scan_tree(root):
+    """
+    Return (Merkle tree, digest function) for the files below root,
+    skipping VERIFY_IGNORED.
+    
+    In a git work tree the digests are git blob ids (see _git_files), so
+    a committed tree is compared without reading its unchanged files.
+    Elsewhere every file is read and hashed with sha256. Compare the tree
+    with one built using the returned digest function.
+    """
+    files = _git_files(root)
+    if files is not None:
+        return build_merkle_tree(files), git_blob_id
+    files = {}
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(d for d in dir_names if d not in VERIFY_IGNORED)
+        rel_dir = os.path.relpath(dir_path, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir
+        for file_name in file_names:
+            if file_name in VERIFY_IGNORED:
+                continue
+            rel_path = f"{rel_dir}/{file_name}" if rel_dir else file_name
+            files[rel_path] = _file_digest(os.path.join(dir_path, file_name))
+    return build_merkle_tree(files), _sha256
+
+def diff_trees(expected, actual, prefix=""):
+    """
+    Yield (status, path) for every difference between two Merkle trees.
+    
+    status is "M" (content differs), "-" (missing from actual) or "+" (only
+    in actual). Subtrees whose hashes match are skipped without descending.
+    """
+    if expected["hash"] == actual["hash"]:
+        return
+    expected_children = expected["children"]
+    actual_children = actual["children"]
+    for name in sorted(expected_children.keys() | actual_children.keys()):
+        path = f"{prefix}{name}"
+        want = expected_children.get(name)
+        have = actual_children.get(name)
+        if have is None:
+            yield "-", path + ("/" if want["children"] is not None else "")
+        elif want is None:
+            yield "+", path + ("/" if have["children"] is not None else "")
+        elif want["hash"] == have["hash"]:
+            continue
+        elif want["children"] is not None and have["children"] is not None:
+            yield from diff_trees(want, have, f"{path}/")
+        else:
+            yield "M", path
+
+def verify_project(project_title, path, description=None, schedule=None, tools=None, answers=None):
+    """
+    Compare a project tree on disk with what the generator renders today.
+    
+    The expected tree is rendered in memory; nothing is written. Empty
+    directories are not compared, so a git checkout verifies cleanly.
+    
+    Args:
+        project_title: The title of the project
+        path: Directory holding the committed project tree
+        description: Problem statement for the main README
+        schedule: Schedule to render
+        tools: Tool names installed by setup/setup.sh
+        answers: prompt_batch.PromptAnswers applied to the expected tree
+    
+    Returns:
+        A list of (status, path) differences (see diff_trees)
+    """
+    sink = MemorySink()
+    write_entries(sink, iter_project_files(project_title, description, schedule, tools))
+    if answers:
+        sink.files.update(answers.for_project(project_title, description, schedule))
+    actual, digest = scan_tree(path)
+    expected = build_merkle_tree({p: digest(data) for p, data in sink.files.items()})
+    return list(diff_trees(expected, actual))
+
+def project_slug(project_title):
+    """Return the directory name used for a project title"""
+    return project_title.lower().replace(' ', '-').replace('_', '-').replace('/', '-')
+
+def load_projects_from_setup(path="setup.sh"):
+    """
+    Read the PROJECTS and PROJECT_DESCRIPTIONS arrays from the org setup script.
+    
+    Args:
+        path: Path to the bash setup script
+    
+    Returns:
+        A list of project specs ({"title": ..., "description": ...})
+    """
+    with open(path) as f:
+        script = f.read()
+    
+    def bash_array(name):
+        match = re.search(rf"^{name}=\((.*?)\)\s*$", script, re.MULTILINE | re.DOTALL)
+        if not match:
+            raise ValueError(f"{path} does not define a {name} array")
+        return shlex.split(match.group(1), comments=True)
+    
+    titles = bash_array("PROJECTS")
+    descriptions = bash_array("PROJECT_DESCRIPTIONS")
+    if len(titles) != len(descriptions):
+        raise ValueError(f"{path}: PROJECTS and PROJECT_DESCRIPTIONS have different lengths")
+    return [{"title": t, "description": d} for t, d in zip(titles, descriptions)]
+
+def load_projects_from_manifest(path):
+    """
+    Read project specs from a JSON manifest.
+    
+    The manifest is either a list of specs or an object with a "projects" list.
+    Each spec is a project title string or an object with a "title" and an
+    optional "description" and "tools" list.
+    
+    Args:
+        path: Path to the JSON manifest
+    
+    Returns:
+        A list of project specs
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    if isinstance(manifest, dict):
+        manifest = manifest.get("projects", [])
+    specs = []
+    for entry in manifest:
+        if isinstance(entry, str):
+            entry = {"title": entry}
+        if "title" not in entry:
+            raise ValueError(f"{path}: project entry without a title: {entry!r}")
+        specs.append(entry)
+    return specs
+
+def _generate_timed(spec, tracing, options, indexer=None):
+    """Build one project in a worker process and return (base_dir, seconds, trace snapshot, indexer)"""
+    tracer = configure_tracing(*tracing)
+    start = time.perf_counter()
+    base_dir = create_project_structure(spec["title"], spec.get("description"), tools=spec.get("tools"),
+                                        indexer=indexer, **options)
+    return base_dir, time.perf_counter() - start, tracer.snapshot() if tracer.enabled else None, indexer
+
+def generate_projects(specs, max_workers=None, output_dir=".", incremental=False, schedule=None,
+                      writers=0, durability="none", indexer=None, answers=None):
+    """
+    Generate several project trees concurrently with a process pool.
+    
+    Args:
+        specs: Project specs as returned by load_projects_from_setup or
+            load_projects_from_manifest. Any iterable works; specs are
+            submitted as soon as they are produced.
+        max_workers: Upper bound on worker processes (defaults to the CPU count)
+        output_dir: Directory in which the project directories are created
+        incremental: Only rewrite files whose content changed
+        schedule: Schedule shared by all projects (with per-project overrides)
+        writers: Writer threads per worker process (0 writes synchronously)
+        durability: One of DURABILITY_MODES
+        indexer: search_index.Indexer; each worker indexes its own project
+            and the results are merged into it
+        answers: prompt_batch.PromptAnswers (see create_project_structure)
+    
+    Returns:
+        A list of (title, base_dir, seconds) tuples in completion order
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if isinstance(specs, (list, tuple)):
+        if not specs:
+            return []
+        workers = min(len(specs), workers)
+    results = []
+    start = time.perf_counter()
+    tracer = TRACER
+    tracing = (tracer.enabled, getattr(tracer, "events", None) is not None)
+    options = {"output_dir": output_dir, "incremental": incremental, "schedule": schedule,
+               "writers": writers, "durability": durability, "answers": answers, "quiet": True}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for spec in specs:
+            child = indexer.fork(project_slug(spec["title"])) if indexer else None
+            futures[pool.submit(_generate_timed, spec, tracing, options, child)] = spec["title"]
+        for future in as_completed(futures):
+            title = futures[future]
+            try:
+                base_dir, seconds, snapshot, child = future.result()
+            except Exception as e:
+                print(f"❌ {title}: {e}", file=sys.stderr)
+                continue
+            if snapshot:
+                tracer.merge(snapshot)
+            if child:
+                indexer.merge(child)
+            print(f"⏱️  {title}: {seconds:.3f}s")
+            results.append((title, base_dir, seconds))
+    print(f"✅ Generated {len(results)}/{len(futures)} projects with {workers} workers in {time.perf_counter() - start:.3f}s")
+    return results
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog")
+CATALOG_CACHE_DIR = ".cache"
+DEFAULT_CATALOG = "default"
+CATALOG_EXTENSIONS = (".json", ".yaml", ".yml")
+
+def find_catalog(project_title, catalog_dir=CATALOG_DIR):
+    """Return the catalog source for a project, falling back to DEFAULT_CATALOG"""
+    for name in (project_slug(project_title), DEFAULT_CATALOG):
+        for ext in CATALOG_EXTENSIONS:
+            path = os.path.join(catalog_dir, name + ext)
+            if os.path.exists(path):
+                return path
+    raise FileNotFoundError(f"No catalog for {project_title!r} or {DEFAULT_CATALOG!r} in {catalog_dir}")
+
+def _compile_catalog(source):
+    """
+    Index a catalog document by week and (week, day).
+    
+    Returns:
+        {"defaults": {...}, "weeks": {week: {...}}, "days": {(week, day): {...}}}
+    """
+    weeks = {}
+    days = {}
+    for week, week_entry in source.get("weeks", {}).items():
+        week = int(week)
+        weeks[week] = {k: v for k, v in week_entry.items() if k != "days"}
+        for day, day_entry in week_entry.get("days", {}).items():
+            days[(week, int(day))] = day_entry
+    return {"defaults": source.get("defaults", {}), "weeks": weeks, "days": days}
+
+def _parse_catalog(path, raw):
+    """Parse catalog source bytes as JSON or, when PyYAML is installed, YAML"""
+    if path.endswith(".json"):
+        return json.loads(raw)
+    if yaml is None:
+        raise RuntimeError(f"PyYAML is required to read {path} (pip install pyyaml)")
+    return yaml.safe_load(raw)
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(path):
+    """
+    Load a content catalog, using a compiled cache next to the source.
+    
+    The compiled (pickled, indexed) form is stored in CATALOG_CACHE_DIR and
+    reused while the source's mtime and size are unchanged. When they
+    differ, the source is hashed and only recompiled if its content changed.
+    Each catalog is loaded at most once per process.
+    
+    Args:
+        path: Path to a .json, .yaml or .yml catalog
+    
+    Returns:
+        The compiled catalog (see _compile_catalog)
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = os.path.join(os.path.dirname(path), CATALOG_CACHE_DIR, os.path.basename(path) + ".pickle")
+    cached = None
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached["stamp"] == stamp:
+            return cached["catalog"]
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        cached = None
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached is not None and cached.get("sha256") == digest:
+        catalog = cached["catalog"]
+    else:
+        catalog = _compile_catalog(_parse_catalog(path, raw))
+    
+    # Write atomically: several generator processes may compile at once
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"stamp": stamp, "sha256": digest, "catalog": catalog}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return catalog
+
+def _catalog_for(catalog, project_title):
+    return catalog or load_catalog(find_catalog(project_title))
+
+def _fill(value, project_title, week=None, day=None):
+    """Fill the {title}, {week} and {day} fields of a catalog default (a string or a list of strings)"""
+    if isinstance(value, list):
+        return [_fill(item, project_title, week, day) for item in value]
+    return value.format(title=project_title, week=week, day=day)
 
-def get_week_theme(week):
+def get_week_theme(week, catalog=None, project_title="Detect_Drift"):
     """Return theme for the specified week"""
-    themes = {
-        1: "Foundation and GitOps Fundamentals",
-        2: "Development Environment and Basic Tools",
-        3: "Kubernetes Resource Management",
-        4: "Building the Core Drift Detection Engine",
-        5: "Git Integration and Source Management",
-        6: "Implementing Basic Policy Controls",
-        7: "Notification and Alerting",
-        8: "Advanced Drift Analysis",
-        9: "Multi-Cluster Support - Part 1",
-        10: "Multi-Cluster Support - Part 2",
-        11: "Error Handling and Resilience",
-        12: "Scaling and Performance",
-        13: "Security Hardening",
-        14: "Monitoring and Observability",
-        15: "API Design and Development",
-        16: "Third-Party Integrations",
-        17: "Authentication and Authorization",
-        18: "Data Management and Retention",
-        19: "Multi-Tenancy Implementation",
-        20: "Billing and Usage Tracking",
-        21: "User Management and Onboarding",
-        22: "Service Level Objectives",
-        23: "Documentation and User Guides",
-        24: "Demonstration and Presentation"
-    }
-    return themes.get(week, f"Week {week} Development")
-
-def get_week_objectives(week):
+    catalog = _catalog_for(catalog, project_title)
+    theme = catalog["weeks"].get(week, {}).get("theme")
+    return theme or _fill(catalog["defaults"]["week_theme"], project_title, week)
+
+def get_week_objectives(week, catalog=None, project_title="Detect_Drift"):
     """Return objectives for the specified week"""
-    objectives = {
-        1: [
-            "Understand GitOps principles and configuration drift concepts",
-            "Set up development environment with necessary tools",
-            "Learn basic Kubernetes resource management",
-            "Create a simple drift detection mechanism",
-            "Document the foundation of our approach"
-        ],
-        2: [
-            "Set up comprehensive development environment",
-            "Master Git workflow for the project",
-            "Understand Kubernetes API interactions",
-            "Implement basic resource comparison utilities",
-            "Create test harness for drift detection"
-        ],
-        # Additional weeks would be defined here
-    }
-    return objectives.get(week, [
-        "Continue developing the Detect_Drift project",
-        "Master relevant DevOps/SRE concepts and tools",
-        "Implement and test new features",
-        "Document progress and decisions",
-        "Prepare for the next phase of development"
-    ])
-
-def get_day_title(week, day):
+    catalog = _catalog_for(catalog, project_title)
+    objectives = catalog["weeks"].get(week, {}).get("objectives")
+    return objectives or _fill(catalog["defaults"]["week_objectives"], project_title, week)
+
+def _day_entry(catalog, week, day, field, project_title, default_field=None):
+    entry = catalog["days"].get((week, day), {}).get(field)
+    return entry or _fill(catalog["defaults"][default_field or field], project_title, week, day)
+
+def get_day_title(week, day, catalog=None, project_title="Detect_Drift"):
     """Generate an appropriate title for the specific day"""
-    day_titles = {
-        (1, 1): "Introduction to GitOps and Configuration Drift",
-        (1, 2): "Setting Up Your Development Environment",
-        (1, 3): "Understanding Kubernetes Resources and State",
-        (1, 4): "Introduction to Drift Detection Approaches",
-        (1, 5): "Building Your First Drift Detector",
-        
-        (2, 1): "Advanced Kubernetes Environment Setup",
-        (2, 2): "Git Workflows and Repository Structure",
-        (2, 3): "Using the Kubernetes API for State Retrieval",
-        (2, 4): "Implementing Resource Comparison Algorithms",
-        (2, 5): "Testing Drift Detection with Various Resources",
-        
-        # Additional days would be defined here
-    }
-    
-    return day_titles.get((week, day), f"Detect_Drift Implementation - Week {week}, Day {day}")
+    return _day_entry(_catalog_for(catalog, project_title), week, day, "title", project_title, "day_title")
 
-def get_why_this_matters(week, day):
+def get_why_this_matters(week, day, catalog=None, project_title="Detect_Drift"):
     """Return why this day's topic matters to DevOps/SRE professionals"""
-    reasons = {
-        (1, 1): "Configuration drift is one of the most common yet challenging problems in modern infrastructure management. When live environments don't match their declared state in version control, it leads to inconsistent environments, failed deployments, security vulnerabilities, and difficult-to-diagnose production issues."
-    }
-    
-    return reasons.get((week, day), "This topic is essential for building a comprehensive drift detection solution and developing critical DevOps/SRE skills.")
+    return _day_entry(_catalog_for(catalog, project_title), week, day, "why_this_matters", project_title)
 
-def get_connection_to_project(week, day):
+def get_connection_to_project(week, day, catalog=None, project_title="Detect_Drift"):
     """Return how this day's work connects to the overall project"""
-    connections = {
-        (1, 1): "Today establishes the foundation for our Detect_Drift tool by understanding the problem space, exploring existing approaches, and defining our unique value proposition. Without this conceptual foundation, we can't build an effective solution."
-    }
-    
-    return connections.get((week, day), "This day's work builds on previous components and adds essential functionality to our Detect_Drift solution.")
+    return _day_entry(_catalog_for(catalog, project_title), week, day, "connection_to_project", project_title)
 
-def get_learning_objectives(week, day):
+def get_learning_objectives(week, day, catalog=None, project_title="Detect_Drift"):
     """Return learning objectives for the specified day"""
-    objectives = {
-        (1, 1): [
-            "Explain the concept of configuration drift and its impact on DevOps practices",
-            "Describe the principles of GitOps and how they relate to drift detection",
-            "Compare at least three existing approaches to drift detection and their limitations",
-            "Set up a basic local Kubernetes environment with a Git repository",
-            "Manually create and detect a simple case of configuration drift"
-        ]
-    }
-    
-    return objectives.get((week, day), [
-        "Implement new functionality for the Detect_Drift tool",
-        "Master relevant DevOps concepts and technologies",
-        "Apply best practices to ensure code quality and testability",
-        "Document implementation decisions and architecture",
-        "Validate solution against real-world scenarios"
-    ])
-
-def get_prerequisites(week, day):
+    return _day_entry(_catalog_for(catalog, project_title), week, day, "learning_objectives", project_title)
+
+def get_prerequisites(week, day, catalog=None, project_title="Detect_Drift"):
     """Return prerequisites for the specified day"""
-    prerequisites = {
-        (1, 1): [
-            "Computer with at least 8GB RAM, 4 CPU cores, and 20GB free disk space",
-            "Basic understanding of Git (cloning, committing, pushing)",
-            "Familiarity with YAML syntax",
-            "Terminal/command-line basics",
-            "Administrator access to install software"
-        ]
-    }
-    
-    return prerequisites.get((week, day), [
-        "Completion of previous day's tasks",
-        "Working development environment",
-        "Understanding of concepts covered previously",
-        "Access to project repository",
-        "Required tools and dependencies installed"
-    ])
+    return _day_entry(_catalog_for(catalog, project_title), week, day, "prerequisites", project_title)
+
+def get_resources(catalog=None, project_title="Detect_Drift"):
+    """Return the entries of the resources README's contents list"""
+    return _fill(_catalog_for(catalog, project_title)["defaults"]["resources"], project_title)
+
+def affected_outputs(old, new):
+    """
+    Return the project files whose content depends on catalog entries that
+    differ between two compiled catalogs.
+    
+    A day entry feeds its day file, and its title also feeds the week
+    README's task list. A week entry feeds only the week README. The
+    defaults feed every file that has no entry of its own, so a change to
+    them returns None, meaning "everything".
+    
+    Returns:
+        A set of paths relative to the project directory, or None
+    """
+    if old["defaults"] != new["defaults"]:
+        return None
+    paths = set()
+    for week in old["weeks"].keys() | new["weeks"].keys():
+        if old["weeks"].get(week) != new["weeks"].get(week):
+            paths.add(f"weekly_tasks/week-{week}/README.md")
+    for week, day in old["days"].keys() | new["days"].keys():
+        before = old["days"].get((week, day), {})
+        after = new["days"].get((week, day), {})
+        if before != after:
+            paths.add(f"weekly_tasks/week-{week}/day-{day}.md")
+            if before.get("title") != after.get("title"):
+                paths.add(f"weekly_tasks/week-{week}/README.md")
+    return paths
+
+def _stat_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def watch_projects(specs, output_dir=".", schedule=None, interval=0.5, debounce=0.2, answers=None, index=None):
+    """
+    Keep generated projects in sync with their catalogs until interrupted.
+    
+    Catalogs are polled every interval seconds. Once a change has settled
+    (no further change for debounce seconds), the old and new catalogs are
+    compared and only the files returned by affected_outputs() are
+    re-rendered and written.
+    
+    Templates live in this module and cannot be reloaded in place, so a
+    change to this file ends the watch and returns True; main() then
+    restarts the process.
+    
+    Args:
+        specs: Project specs to generate and watch
+        output_dir: Directory in which the project directories are created
+        schedule: Schedule shared by all projects
+        interval: Polling interval in seconds
+        debounce: Quiet period that must pass after a change before
+            re-rendering, so editors that save in several steps trigger
+            one update
+        answers: prompt_batch.PromptAnswers (see create_project_structure)
+        index: Search index file (see search_index.py) updated with every
+            re-rendered file
+    
+    Returns:
+        True if the generator source changed, False on Ctrl+C
+    """
+    source = os.path.abspath(__file__)
+    if index:
+        import search_index
+    
+    def poll():
+        try:
+            paths = {spec["title"]: find_catalog(spec["title"]) for spec in specs}
+        except FileNotFoundError:
+            # Editors that save by delete-then-write leave no catalog for a moment
+            return None
+        return paths, {path: _stat_stamp(path) for path in {source, *paths.values()}}
+    
+    indexer = search_index.Indexer.for_index(index) if index else None
+    for spec in specs:
+        create_project_structure(spec["title"], spec.get("description"), output_dir, incremental=True,
+                                 schedule=schedule, tools=spec.get("tools"), indexer=indexer, answers=answers)
+    if indexer:
+        indexer.save(index)
+    paths, stamps = poll()
+    catalogs = {title: load_catalog(path) for title, path in paths.items()}
+    print(f"👀 Watching {len(set(paths.values()))} catalog(s) for {len(specs)} project(s); press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(interval)
+            current = poll()
+            if current is None or current == (paths, stamps):
+                continue
+            while True:
+                time.sleep(debounce)
+                settled = poll()
+                if settled is not None and settled == current:
+                    break
+                current = settled
+            if current[1][source] != stamps[source]:
+                print(f"♻️  {os.path.basename(source)} changed; restarting")
+                return True
+            paths, stamps = current
+            
+            load_catalog.cache_clear()
+            for spec in specs:
+                title = spec["title"]
+                try:
+                    catalog = load_catalog(paths[title])
+                except Exception as e:
+                    # Half-written edits are common; keep watching and retry on the next save
+                    print(f"❌ {paths[title]}: {e}", file=sys.stderr)
+                    continue
+                only = affected_outputs(catalogs[title], catalog)
+                catalogs[title] = catalog
+                if only is not None and not only:
+                    continue
+                start = time.perf_counter()
+                sink = FileSystemSink(output_dir, incremental=True, partial=only is not None)
+                indexer = search_index.Indexer.for_index(index, partial=only is not None) if index else None
+                with sink:
+                    write_entries(_wrap_sink(sink, title, spec.get("description"), schedule, indexer, answers),
+                                  _iter_prefixed_entries(title, spec.get("description"), schedule, spec.get("tools"), only))
+                if indexer:
+                    indexer.save(index)
+                counts = sink.counts
+                rendered = counts["created"] + counts["updated"] + counts["unchanged"]
+                print(f"🔁 {title}: re-rendered {rendered} file(s), wrote {counts['created'] + counts['updated']} "
+                      f"in {(time.perf_counter() - start) * 1000:.1f}ms")
+    except KeyboardInterrupt:
+        return False
+
+def positive_int(text):
+    """argparse type for options that need a count of at least one"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text}")
+    return value
+
+def non_negative_int(text):
+    """argparse type for counts where 0 disables the feature"""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got {text}")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate internship project scaffolds")
+    parser.add_argument("title", nargs="?", default="Detect_Drift", help="Title of a single project to generate")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--all", action="store_true", help="Generate every project listed in setup.sh")
+    source.add_argument("--manifest", help="Generate every project listed in a JSON manifest")
+    parser.add_argument("--setup-script", default="setup.sh", help="Setup script read by --all (default: setup.sh)")
+    parser.add_argument("-j", "--workers", type=positive_int, help="Maximum number of worker processes for batch generation")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory in which projects are created")
+    parser.add_argument("-i", "--incremental", action="store_true", help="Only rewrite files whose content changed since the last run")
+    parser.add_argument("--archive", choices=ARCHIVE_FORMATS, help="Stream the generated tree(s) into an archive instead of writing to disk")
+    parser.add_argument("--archive-file", default="-", help="Archive destination for --archive (default: stdout)")
+    parser.add_argument("--writers", type=non_negative_int, default=0, help="Write files from a pool of N threads (useful on network filesystems)")
+    parser.add_argument("--durability", choices=DURABILITY_MODES, default="none",
+                        help="none, fsync every file as it is written, or fsync the files and their directories in one batch at the end (default: none)")
+    parser.add_argument("--weeks", type=int, help="Number of weeks in the programme (default: 24)")
+    parser.add_argument("--days-per-week", type=int, help="Number of working days per week (default: 5)")
+    parser.add_argument("--schedule", help="JSON file with a \"schedule\" object (defaults to the --manifest file)")
+    parser.add_argument("--trace", action="store_true", help=f"Print per-phase timings to stderr (or set {TRACE_ENV}=1)")
+    parser.add_argument("--trace-file", help=f"Write a Chrome trace-event JSON file (or set {TRACE_FILE_ENV})")
+    parser.add_argument("--verify", nargs="?", const="", metavar="DIR",
+                        help="Compare committed trees with the generator output instead of writing "
+                             "(DIR overrides the project directory of a single project)")
+    parser.add_argument("--index", metavar="FILE",
+                        help="Update a search index of the generated markdown (query it with search_index.py)")
+    parser.add_argument("--answers", metavar="DIR",
+                        help="Write cached prompt_batch.py answers from DIR in place of the templated day files")
+    parser.add_argument("--prompt-template", help="Prompt template the answers were generated from (default: daily_prompt.md)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-render the files affected by each catalog edit")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Catalog polling interval for --watch in seconds (default: 0.5)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="List the paths and sizes that would be written without writing anything")
+    args = parser.parse_args(argv)
+    try:
+        specs, schedule = resolve_projects(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.verify and len(specs) > 1:
+        parser.error(f"--verify DIR compares a single project, but {len(specs)} projects were selected; "
+                     "omit DIR to verify each project in its --output-dir directory")
+    
+    trace_file = args.trace_file or os.environ.get(TRACE_FILE_ENV)
+    if args.trace or args.trace_file:
+        configure_tracing(True, bool(trace_file))
+    try:
+        return _run(args, specs, schedule)
+    finally:
+        if TRACER.enabled:
+            TRACER.report()
+            if trace_file:
+                TRACER.write_chrome_trace(trace_file)
+                print(f"🧭 Trace written to {trace_file}", file=sys.stderr)
+
+def resolve_projects(args):
+    """
+    Return the (specs, schedule) selected on a command line.
+    
+    Shared by the command line tools that take a project title or
+    --all/--manifest, --setup-script, --schedule, --weeks and --days-per-week.
+    """
+    if args.all:
+        specs = load_projects_from_setup(args.setup_script)
+    elif args.manifest:
+        specs = load_projects_from_manifest(args.manifest)
+    else:
+        specs = [{"title": args.title}]
+    
+    schedule_file = args.schedule or args.manifest
+    schedule = (load_schedule(schedule_file) if schedule_file else None) or Schedule()
+    if args.weeks is not None or args.days_per_week is not None:
+        weeks = args.weeks if args.weeks is not None else schedule.weeks
+        days_per_week = args.days_per_week if args.days_per_week is not None else schedule.days_per_week
+        schedule = Schedule(weeks, days_per_week, schedule.overrides)
+    return specs, schedule
+
+def _run(args, specs, schedule):
+    answers = None
+    if args.answers:
+        import prompt_batch
+        answers = prompt_batch.PromptAnswers(args.answers, args.prompt_template or prompt_batch.DEFAULT_TEMPLATE)
+    
+    if args.verify is not None:
+        drifted = 0
+        for spec in specs:
+            path = args.verify or os.path.join(args.output_dir, project_slug(spec["title"]))
+            differences = verify_project(spec["title"], path, spec.get("description"), schedule, spec.get("tools"), answers)
+            for status, rel_path in differences:
+                print(f"{status} {os.path.join(path, rel_path)}")
+            drifted += bool(differences)
+        print(f"{'❌' if drifted else '✅'} {drifted}/{len(specs)} project(s) drifted from the generator output", file=sys.stderr)
+        return 1 if drifted else 0
+    
+    if args.dry_run:
+        sink = DryRunSink()
+        for spec in specs:
+            create_project_structure(spec["title"], spec.get("description"), sink=sink, schedule=schedule,
+                                     tools=spec.get("tools"), answers=answers)
+        for path, size, mode in sink.planned:
+            if size is None:
+                print(f"{path}/")
+            else:
+                print(f"{path}  {size} bytes" + (f"  mode {mode:o}" if mode is not None else ""))
+        counts = sink.close()
+        print(f"📝 Would write {counts['files']} files ({counts['bytes']} bytes) in {counts['directories']} directories")
+        return 0
+    
+    if args.archive:
+        if args.archive_file == "-":
+            count = write_archive(specs, sys.stdout.buffer, args.archive, schedule, answers)
+            sys.stdout.buffer.flush()
+        else:
+            with open(args.archive_file, 'wb') as f:
+                count = write_archive(specs, f, args.archive, schedule, answers)
+        print(f"📦 Wrote {count} entries for {len(specs)} project(s) to {args.archive} archive", file=sys.stderr)
+        return 0
+    
+    if args.watch:
+        if watch_projects(specs, args.output_dir, schedule, args.poll_interval, answers=answers, index=args.index):
+            os.execv(sys.executable, [sys.executable, os.path.abspath(__file__), *sys.argv[1:]])
+        return 0
+    
+    indexer = None
+    if args.index:
+        import search_index
+        indexer = search_index.Indexer.for_index(args.index)
+    
+    if args.all or args.manifest:
+        results = generate_projects(specs, max_workers=args.workers, output_dir=args.output_dir,
+                                    incremental=args.incremental, schedule=schedule,
+                                    writers=args.writers, durability=args.durability, indexer=indexer,
+                                    answers=answers)
+        status = 0 if len(results) == len(specs) else 1
+    else:
+        try:
+            create_project_structure(args.title, output_dir=args.output_dir, incremental=args.incremental, schedule=schedule,
+                                     writers=args.writers, durability=args.durability, indexer=indexer,
+                                     answers=answers)
+        except WriteError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        status = 0
+    
+    if indexer:
+        count = indexer.save(args.index)
+        print(f"🔎 Re-indexed {count} of {len(indexer.seen)} documents in {args.index}")
+    return status
 
 # Command line interface
 if __name__ == "__main__":
-    create_project_structure("Detect_Drift")
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
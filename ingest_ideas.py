@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Turn the project ideas catalogues into generated project scaffolds.
+
+Parses project_ideas.md, Mlops_Project_Ideas.md and
+Final_Mlops_intern_projects.md into project specs (title, problem statement,
+tools to install) and feeds them into a parallel generate_projects() run.
+Parse results are cached by file hash, so unchanged catalogues are not
+parsed again.
+
+Usage:
+    python ingest_ideas.py -o generated
+    python ingest_ideas.py --list > manifest.json
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+
+import generate_project
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCES = ["project_ideas.md", "Mlops_Project_Ideas.md", "Final_Mlops_intern_projects.md"]
+CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "ideas")
+PARSER_VERSION = 1
+
+# Lines that start a project in each catalogue layout
+PROJECT_HEADINGS = [
+    re.compile(r"^###\s+\d+\.\s+(?P<title>.+?)\s*$"),           # ### 1. Drift-Detect
+    re.compile(r"^##\s+Project\s+\d+:\s+(?P<title>.+?)\s*$"),   # ## Project 1: Model-Drift-Monitor
+    re.compile(r"^Project Title:\s*(?P<title>.+?)\s*$"),         # Project Title: Model-Drift-Monitor
+]
+
+# Lines that start a section within a project
+SECTION_HEADINGS = [
+    re.compile(r"^\*\*(?P<name>[^*]+?):\*\*\s*$"),               # **Pain Point:**
+    re.compile(r"^###\s+(?P<name>\D.*?)\s*$"),                   # ### Problem Statement
+    re.compile(r"^(?P<name>[A-Z][A-Za-z ]+):\s*$"),              # Problem Statement:
+]
+
+PROBLEM_SECTIONS = ("Problem Statement", "Project Description")
+TOOLS_PREFIX = re.compile(r"^(?:-\s*)?Core technologies:\s*(?P<tools>.+)$", re.IGNORECASE)
+
+def _match(patterns, line, group):
+    for pattern in patterns:
+        match = pattern.match(line)
+        if match:
+            return match.group(group)
+    return None
+
+def _finish(title, sections, source):
+    """Build a project spec from the collected sections of one project"""
+    spec = {"title": title, "source": source}
+    for name in PROBLEM_SECTIONS:
+        text = " ".join(line.strip() for line in sections.get(name, []) if line.strip())
+        if text:
+            spec["description"] = text
+            break
+    for lines in sections.values():
+        for line in lines:
+            match = TOOLS_PREFIX.match(line.strip())
+            if match:
+                spec["tools"] = [tool.strip() for tool in match.group("tools").split(",") if tool.strip()]
+                return spec
+    return spec
+
+def parse_ideas(lines, source=""):
+    """
+    Lazily parse catalogue lines into project specs.
+
+    A spec is yielded as soon as the next project (or the next top-level
+    heading) starts, so callers can act on it while parsing continues.
+
+    Args:
+        lines: Iterable of markdown lines
+        source: Name recorded in each spec's "source" field
+
+    Yields:
+        {"title", "description", "tools", "source"} dicts; "description" and
+        "tools" are omitted when the catalogue does not provide them
+    """
+    title = None
+    sections = {}
+    section = None
+    for line in lines:
+        line = line.rstrip("\n")
+        project_title = _match(PROJECT_HEADINGS, line, "title")
+        if project_title:
+            if title:
+                yield _finish(title, sections, source)
+            title, sections, section = project_title, {}, None
+            continue
+        if line.startswith("## ") or line.startswith("# "):
+            if title:
+                yield _finish(title, sections, source)
+            title, sections, section = None, {}, None
+            continue
+        if title is None:
+            continue
+        name = _match(SECTION_HEADINGS, line, "name")
+        if name:
+            section = name.strip()
+            sections.setdefault(section, [])
+        elif section:
+            sections[section].append(line)
+    if title:
+        yield _finish(title, sections, source)
+
+def load_ideas(path, cache_dir=CACHE_DIR):
+    """
+    Yield the project specs of one catalogue file.
+
+    Results are cached in cache_dir under the sha256 of the file, so an
+    unchanged file is never parsed twice.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw + f"\0{PARSER_VERSION}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{digest}.json")
+    try:
+        with open(cache_path) as f:
+            yield from json.load(f)
+        return
+    except (OSError, ValueError):
+        pass
+
+    specs = []
+    for spec in parse_ideas(raw.decode().splitlines(), os.path.basename(path)):
+        specs.append(spec)
+        yield spec
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(specs, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+def iter_project_specs(paths, cache_dir=CACHE_DIR):
+    """Yield the specs of several catalogues, skipping titles already seen in an earlier file"""
+    seen = set()
+    for path in paths:
+        for spec in load_ideas(path, cache_dir):
+            slug = generate_project.project_slug(spec["title"])
+            if slug in seen:
+                continue
+            seen.add(slug)
+            yield spec
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate project scaffolds from the project ideas markdown files")
+    parser.add_argument("sources", nargs="*", help="Catalogue files (default: the three ideas files in this repository)")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory in which projects are created")
+    parser.add_argument("-j", "--workers", type=generate_project.positive_int, help="Maximum number of worker processes")
+    parser.add_argument("-i", "--incremental", action="store_true", help="Only rewrite files whose content changed since the last run")
+    parser.add_argument("--answers", metavar="DIR", help="Write cached prompt_batch.py answers from DIR in place of the templated day files")
+    parser.add_argument("--prompt-template", help="Prompt template the answers were generated from (default: daily_prompt.md)")
+    parser.add_argument("--list", action="store_true", help="Print the parsed specs as a JSON manifest instead of generating")
+    args = parser.parse_args(argv)
+
+    sources = args.sources or [os.path.join(REPO_ROOT, name) for name in DEFAULT_SOURCES]
+    specs = iter_project_specs(sources)
+    if args.list:
+        json.dump({"projects": list(specs)}, sys.stdout, indent=2)
+        print()
+        return 0
+
+    answers = None
+    if args.answers:
+        import prompt_batch
+        answers = prompt_batch.PromptAnswers(args.answers, args.prompt_template or prompt_batch.DEFAULT_TEMPLATE)
+    submitted = 0
+
+    def counted(specs):
+        nonlocal submitted
+        for spec in specs:
+            submitted += 1
+            yield spec
+
+    results = generate_project.generate_projects(counted(specs), max_workers=args.workers, output_dir=args.output_dir,
+                                                 incremental=args.incremental, answers=answers)
+    return 0 if submitted and len(results) == submitted else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Fill the daily task files from the daily_prompt.md template in one batch.
+
+Expands the prompt template for every (project, week, day) of the schedule,
+sends the prompts that are not cached yet to a completion backend from a
+bounded thread pool (retrying transient failures), and stores each answer in
+a content-addressed cache keyed by the sha256 of the rendered prompt. The
+projects are then generated with every cached answer written in place of
+the templated day-N.md.
+
+The generator only keeps the answers when it reads the same cache: pass
+--answers (and --prompt-template if --template was used) to
+generate_project.py, ingest_ideas.py and provision.py, or later runs, --watch
+and --verify go back to the templated day files.
+
+Backends:
+    stub      Deterministic local answers, for testing the pipeline
+    command   Pipe the prompt to a shell command and read the answer from stdout
+    http      POST to an OpenAI-compatible /chat/completions endpoint
+
+Usage:
+    python prompt_batch.py Detect_Drift --backend stub
+    python prompt_batch.py --manifest projects.json --backend command --command "llm -m gpt-4o"
+    python prompt_batch.py --all --backend http --url http://localhost:8000/v1 --model llama3 -c 16
+"""
+import os
+import re
+import sys
+import json
+import time
+import shlex
+import random
+import hashlib
+import argparse
+import threading
+import subprocess
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import generate_project
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(REPO_ROOT, "daily_prompt.md")
+CACHE_DIR = os.path.join(REPO_ROOT, ".cache", "prompts")
+API_KEY_ENV = "PROMPT_BATCH_API_KEY"
+
+# Placeholders used by daily_prompt.md and final_prompt.md
+PLACEHOLDERS = {
+    "[X]": "week",
+    "[Y]": "day",
+    "[specific focus for this day]": "focus",
+    "[specific area relevant to this day]": "focus",
+    "[Detect_Drift]": "title",
+    "[PROJECT_TITLE]": "title",
+    "Detect_Drift": "title",
+    "[Config drift between Git and live clusters]": "description",
+}
+# Longest first, so "[Detect_Drift]" wins over "Detect_Drift"
+PLACEHOLDER_PATTERN = re.compile("|".join(re.escape(p) for p in sorted(PLACEHOLDERS, key=len, reverse=True)))
+
+class BackendError(Exception):
+    """Raised by a backend; retryable errors are attempted again"""
+
+    def __init__(self, message, retryable=False):
+        self.retryable = retryable
+        super().__init__(message)
+
+class StubBackend:
+    """
+    Answer prompts locally without any model.
+
+    The answer echoes the prompt's "# Week X Day Y" heading and its hash, so
+    it is deterministic. delay simulates model latency and flaky makes the
+    first flaky attempts of every prompt fail with a retryable error.
+    """
+
+    def __init__(self, delay=0.0, flaky=0):
+        self.delay = delay
+        self.flaky = flaky
+        self._attempts = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt):
+        digest = prompt_digest(prompt)
+        with self._lock:
+            attempt = self._attempts[digest] = self._attempts.get(digest, 0) + 1
+        time.sleep(self.delay)
+        if attempt <= self.flaky:
+            raise BackendError(f"stub failure {attempt}/{self.flaky}", retryable=True)
+        match = re.search(r"^# Week .*$", prompt, re.MULTILINE)
+        heading = match.group(0) if match else "# Generated Task"
+        return f"{heading}\n\n_Stub answer for prompt {digest[:12]}._\n"
+
+class CommandBackend:
+    """Run a shell command per prompt, passing the prompt on stdin"""
+
+    def __init__(self, command, timeout=600):
+        self.argv = shlex.split(command)
+        self.timeout = timeout
+
+    def __call__(self, prompt):
+        try:
+            result = subprocess.run(self.argv, input=prompt, capture_output=True, text=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            raise BackendError(f"{self.argv[0]} timed out after {self.timeout}s", retryable=True)
+        except OSError as e:
+            raise BackendError(str(e))
+        if result.returncode != 0:
+            raise BackendError(f"{self.argv[0]} exited with {result.returncode}: {result.stderr.strip()[:200]}",
+                               retryable=True)
+        return result.stdout
+
+class HttpBackend:
+    """Request chat completions from an OpenAI-compatible HTTP API"""
+
+    def __init__(self, url, model, api_key=None, timeout=600):
+        self.url = url.rstrip("/") + "/chat/completions"
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def __call__(self, prompt):
+        payload = {"model": self.model, "messages": [{"role": "user", "content": prompt}]}
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(self.url, json.dumps(payload).encode(), headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.load(response)
+        except urllib.error.HTTPError as e:
+            raise BackendError(f"{e.code} {e.reason} ({self.url})", retryable=e.code == 429 or e.code >= 500)
+        except (OSError, ValueError) as e:
+            raise BackendError(f"{e} ({self.url})", retryable=True)
+        try:
+            return data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            raise BackendError(f"Unexpected response from {self.url}: {str(data)[:200]}")
+
+def prompt_digest(prompt):
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+class PromptCache:
+    """Answers stored on disk as <cache_dir>/<digest[:2]>/<digest>.md"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, digest):
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.md")
+
+    def get(self, digest):
+        try:
+            with open(self._path(digest)) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, digest, answer):
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(answer)
+        os.replace(tmp_path, path)
+
+def render_prompt(template, title, week, day, focus, description=None):
+    """Fill the placeholders of a prompt template for one day of a project"""
+    values = {"title": title, "week": str(week), "day": str(day), "focus": focus,
+              "description": description or generate_project.DEFAULT_PROBLEM_STATEMENT}
+    return PLACEHOLDER_PATTERN.sub(lambda m: values[PLACEHOLDERS[m.group(0)]], template)
+
+def iter_day_prompts(project_title, template, description=None, schedule=None):
+    """
+    Yield (path, prompt) for every day of a project.
+
+    path is the day file relative to the project directory. The day's
+    catalog title is used as its focus.
+    """
+    schedule = (schedule or generate_project.DEFAULT_SCHEDULE).for_project(project_title)
+    catalog = generate_project.load_catalog(generate_project.find_catalog(project_title))
+    for week in range(1, schedule.weeks + 1):
+        for day in range(1, schedule.days_per_week + 1):
+            focus = generate_project.get_day_title(week, day, catalog, project_title)
+            yield (f"weekly_tasks/week-{week}/day-{day}.md",
+                   render_prompt(template, project_title, week, day, focus, description))
+
+def iter_batch_prompts(specs, template, schedule=None):
+    """Yield (path, prompt) for every day of every project, with paths relative to the output directory"""
+    for spec in specs:
+        slug = generate_project.project_slug(spec["title"])
+        for path, prompt in iter_day_prompts(spec["title"], template, spec.get("description"), schedule):
+            yield f"{slug}/{path}", prompt
+
+def complete(backend, prompt, retries=3, backoff=1.0):
+    """Call backend(prompt), retrying retryable errors with jittered exponential backoff"""
+    for attempt in range(retries + 1):
+        try:
+            return backend(prompt)
+        except BackendError as e:
+            if not e.retryable or attempt == retries:
+                raise
+            time.sleep(min(60.0, backoff * 2 ** attempt) * random.uniform(0.5, 1.0))
+
+def fill_answers(prompts, backend, cache, concurrency=8, retries=3, backoff=1.0):
+    """
+    Resolve prompts to answers through the cache and the backend.
+
+    Identical prompts are requested once. Answers are cached as soon as they
+    arrive, so an interrupted batch resumes where it stopped.
+
+    Args:
+        prompts: Iterable of (path, prompt)
+        backend: Callable taking a prompt and returning the answer text
+        cache: PromptCache
+        concurrency: Maximum number of requests in flight
+        retries: Retries per prompt for retryable backend errors
+        backoff: Base delay in seconds between retries
+
+    Returns:
+        A dict of counts: "prompts", "cached", "requested" and "failed"
+    """
+    pending = {}
+    counts = {"prompts": 0, "cached": 0, "requested": 0, "failed": 0}
+    for path, prompt in prompts:
+        counts["prompts"] += 1
+        digest = prompt_digest(prompt)
+        if cache.get(digest) is not None:
+            counts["cached"] += 1
+        else:
+            pending.setdefault(digest, (prompt, []))[1].append(path)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(complete, backend, prompt, retries, backoff): digest
+                   for digest, (prompt, _) in pending.items()}
+        for future in as_completed(futures):
+            digest = futures[future]
+            paths = pending[digest][1]
+            try:
+                answer = future.result()
+            except BackendError as e:
+                print(f"❌ {paths[0]}: {e}", file=sys.stderr)
+                counts["failed"] += len(paths)
+                continue
+            cache.put(digest, answer)
+            counts["requested"] += 1
+    return counts
+
+class AnswerSink(generate_project.ForwardingSink):
+    """Forward entries to another sink, replacing files that have an answer"""
+
+    def __init__(self, inner, answers):
+        super().__init__(inner)
+        self.answers = answers
+
+    def write(self, path, data, mode=None):
+        super().write(path, self.answers.get(path, data), mode)
+
+class PromptAnswers:
+    """
+    Cached answers as the generator sees them (generate_project.py --answers).
+
+    Every day file whose rendered prompt has a cached answer is replaced by
+    that answer; the other days keep their templated content. Picklable, so
+    batch worker processes can use it.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, template_path=DEFAULT_TEMPLATE):
+        with open(template_path) as f:
+            self.template = f.read()
+        self.cache = PromptCache(cache_dir)
+
+    def for_project(self, project_title, description=None, schedule=None):
+        """Return {day file path relative to the project: answer bytes} for the days that have an answer"""
+        answers = {}
+        for path, prompt in iter_day_prompts(project_title, self.template, description, schedule):
+            answer = self.cache.get(prompt_digest(prompt))
+            if answer is not None:
+                answers[path] = answer.encode() if answer.endswith("\n") else f"{answer}\n".encode()
+        return answers
+
+    def wrap(self, sink, project_title, description=None, schedule=None):
+        slug = generate_project.project_slug(project_title)
+        answers = self.for_project(project_title, description, schedule)
+        return AnswerSink(sink, {f"{slug}/{path}": data for path, data in answers.items()})
+
+def make_backend(args):
+    if args.backend == "stub":
+        return StubBackend(args.stub_delay, args.stub_flaky)
+    if args.backend == "command":
+        if not args.command:
+            raise SystemExit("--backend command requires --command")
+        return CommandBackend(args.command, args.timeout)
+    if not args.url or not args.model:
+        raise SystemExit("--backend http requires --url and --model")
+    return HttpBackend(args.url, args.model, os.environ.get(API_KEY_ENV), args.timeout)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fill day files from daily_prompt.md with a completion backend")
+    parser.add_argument("title", nargs="?", default="Detect_Drift", help="Title of a single project")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--all", action="store_true", help="Every project listed in setup.sh")
+    source.add_argument("--manifest", help="Every project listed in a JSON manifest")
+    parser.add_argument("--setup-script", default=os.path.join(REPO_ROOT, "setup.sh"), help="Setup script read by --all")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory in which projects are created")
+    parser.add_argument("--schedule", help="JSON file with a \"schedule\" object (defaults to the --manifest file)")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE, help="Prompt template (default: daily_prompt.md)")
+    parser.add_argument("--weeks", type=int, help="Number of weeks in the programme (default: 24)")
+    parser.add_argument("--days-per-week", type=int, help="Number of working days per week (default: 5)")
+    parser.add_argument("--backend", choices=("stub", "command", "http"), default="stub", help="Completion backend (default: stub)")
+    parser.add_argument("--command", help="Shell command for --backend command; reads the prompt on stdin")
+    parser.add_argument("--url", help="API base URL for --backend http, e.g. http://localhost:8000/v1")
+    parser.add_argument("--model", help=f"Model name for --backend http (API key from {API_KEY_ENV})")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds per request (default: 600)")
+    parser.add_argument("--stub-delay", type=float, default=0.0, help="Simulated latency of the stub backend in seconds")
+    parser.add_argument("--stub-flaky", type=int, default=0, help="Transient stub failures per prompt before it succeeds")
+    parser.add_argument("-c", "--concurrency", type=generate_project.positive_int, default=8, help="Requests in flight at once (default: 8)")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per prompt for transient errors (default: 3)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="Answer cache directory (default: .cache/prompts)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Only report how many prompts are cached")
+    args = parser.parse_args(argv)
+
+    try:
+        specs, schedule = generate_project.resolve_projects(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    with open(args.template) as f:
+        template = f.read()
+    cache = PromptCache(args.cache_dir)
+    prompts = iter_batch_prompts(specs, template, schedule)
+
+    if args.dry_run:
+        total = cached = 0
+        for _, prompt in prompts:
+            total += 1
+            cached += cache.get(prompt_digest(prompt)) is not None
+        print(f"🧠 {cached}/{total} prompts cached")
+        return 0
+
+    start = time.perf_counter()
+    counts = fill_answers(prompts, make_backend(args), cache, args.concurrency, args.retries)
+    print(f"🧠 {counts['prompts']} prompts: {counts['cached']} cached, {counts['requested']} requested, "
+          f"{counts['failed']} failed in {time.perf_counter() - start:.2f}s")
+
+    # The same path the generator takes with --answers, so both write identical bytes
+    answers = PromptAnswers(args.cache_dir, args.template)
+    for spec in specs:
+        generate_project.create_project_structure(spec["title"], spec.get("description"), args.output_dir, incremental=True,
+                                                  schedule=schedule, tools=spec.get("tools"), answers=answers)
+    return 1 if counts["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Provision the GitHub repositories of the internship organisation.
+
+Replaces the serial gh loop in setup.sh: repositories are provisioned
+concurrently over a pooled keep-alive HTTP client, existence checks and issue
+creation are batched through GraphQL, secondary rate limits pause every
+worker until GitHub allows requests again, and each generated tree is pushed
+as a single commit through the git data API instead of clone + commit + push.
+
+Point --api-url at a local mock server (benchmarks/mock_github.py, which can
+also inject rate limits, lost responses and stale connections) to exercise
+it without GitHub.
+"""
+import os
+import re
+import sys
+import json
+import time
+import queue
+import random
+import shutil
+import argparse
+import threading
+import subprocess
+import http.client
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import generate_project
+
+DEFAULT_API_URL = "https://api.github.com"
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+ISSUE_TEMPLATE_DIR = os.path.join(REPO_ROOT, ".github", "ISSUE_TEMPLATE")
+WORKFLOW_DIR = os.path.join(REPO_ROOT, ".github", "workflows")
+WEEK_PLACEHOLDERS = ("[NUMBER]", "{{week_number}}")
+ISSUES_PER_MUTATION = 20
+# Methods that may be sent again when a response is lost in transit
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "PATCH", "DELETE")
+# Failures of a kept-alive connection that the server closed before reading the request
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+CONTRIBUTING_TEMPLATE = """\
+# Contributing to {project}
+
+Thank you for your interest in contributing to this project!
+
+## Pull Request Process
+
+## Code Style Guidelines
+
+## Testing Requirements
+"""
+
+ONBOARDING_TEMPLATE = """\
+# Onboarding Guide for {project}
+
+Welcome to the {project} internship! This guide will help you get started.
+
+## First-Day Checklist
+
+## Development Environment
+
+## Project Structure
+"""
+
+class GitHubError(Exception):
+    """Raised for a GitHub API response that is not a success"""
+
+    def __init__(self, status, message, path=None):
+        self.status = status
+        self.path = path
+        super().__init__(f"{status} {message}" + (f" ({path})" if path else ""))
+
+class GitHubClient:
+    """
+    Minimal thread-safe GitHub REST/GraphQL client over pooled keep-alive connections.
+
+    When GitHub reports a primary or secondary rate limit (REST, or a
+    RATE_LIMITED GraphQL error), every thread sharing the client waits until
+    the limit resets (Retry-After, x-ratelimit-reset, or exponential backoff
+    with jitter) before retrying. Connection errors are only retried for
+    idempotent requests: a mutation whose response was lost may already have
+    been applied. The exception is a pooled connection that turns out to be
+    closed before any response arrives: the server dropped it while idle, so
+    the request is sent once more on a fresh connection.
+    """
+
+    def __init__(self, token, api_url=DEFAULT_API_URL, max_connections=8, max_retries=5, timeout=30):
+        parts = urlsplit(api_url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.token = token
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._pool = queue.LifoQueue()
+        self._connections = threading.BoundedSemaphore(max_connections)
+        self._resume_at = 0.0
+        self._resume_lock = threading.Lock()
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, timeout=self.timeout)
+
+    def _wait_for_rate_limit(self):
+        with self._resume_lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause(self, seconds):
+        """Make every thread wait `seconds` before its next request"""
+        with self._resume_lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _reset_delay(self, headers):
+        """Return the wait announced by rate limit headers, or None"""
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+        if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset"):
+            return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + 1
+        return None
+
+    def _rate_limit_delay(self, status, headers, body, attempt):
+        """Return how long to wait before retrying, or None if the response is not a rate limit"""
+        if status not in (403, 429):
+            return None
+        delay = self._reset_delay(headers)
+        if delay is not None:
+            return delay
+        message = (body or {}).get("message", "") if isinstance(body, dict) else ""
+        if status == 429 or "rate limit" in message.lower():
+            return min(60.0, 2 ** attempt) + random.uniform(0, 1)
+        return None
+
+    def _send(self, method, path, payload):
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": "cvt-intern-provision",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode()
+            headers["Content-Type"] = "application/json"
+
+        self._connections.acquire()
+        try:
+            try:
+                conn, reused = self._pool.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(), False
+            while True:
+                try:
+                    conn.request(method, self.prefix + path, body=body, headers=headers)
+                    response = conn.getresponse()
+                except STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if not reused:
+                        raise
+                    conn, reused = self._connect(), False
+                    continue
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    raise
+                break
+            try:
+                raw = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                raise
+            self._pool.put(conn)
+        finally:
+            self._connections.release()
+
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        data = json.loads(raw) if raw else None
+        return response.status, response_headers, data
+
+    def _request(self, method, path, payload, ok, idempotent):
+        """Send a request with retries; returns (headers, data)"""
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                status, headers, data = self._send(method, path, payload)
+            except (OSError, http.client.HTTPException) as e:
+                if not idempotent:
+                    raise GitHubError(0, f"{e}; not retried because the request may have been applied", path)
+                if attempt == self.max_retries:
+                    raise GitHubError(0, str(e), path)
+                time.sleep(min(30.0, 2 ** attempt))
+                continue
+            if status in ok:
+                return headers, data
+            delay = self._rate_limit_delay(status, headers, data, attempt)
+            if delay is None or attempt == self.max_retries:
+                message = data.get("message", "") if isinstance(data, dict) else ""
+                raise GitHubError(status, message, path)
+            self._pause(delay)
+        raise GitHubError(0, "retries exhausted", path)
+
+    def request(self, method, path, payload=None, ok=(200, 201, 204), idempotent=None):
+        """
+        Send a REST request and return the decoded JSON body.
+
+        Rate limits are retried up to max_retries times. Connection errors
+        are retried too when the request is idempotent (by default: the
+        methods in IDEMPOTENT_METHODS). Any other status outside `ok`
+        raises GitHubError.
+        """
+        return self._request(method, path, payload, ok, idempotent)[1]
+
+    def graphql(self, query, variables=None):
+        """
+        Run a GraphQL query or mutation; returns (data, errors).
+
+        A RATE_LIMITED error means nothing was executed, so the request is
+        retried once the limit resets. Queries are also retried on
+        connection errors; mutations are not.
+        """
+        payload = {"query": query, "variables": variables or {}}
+        idempotent = not query.lstrip().startswith("mutation")
+        for attempt in range(self.max_retries + 1):
+            headers, result = self._request("POST", "/graphql", payload, (200,), idempotent)
+            errors = result.get("errors") or []
+            if attempt == self.max_retries or not any(error.get("type") == "RATE_LIMITED" for error in errors):
+                return result.get("data") or {}, errors
+            delay = self._reset_delay(headers)
+            self._pause(delay if delay is not None else min(60.0, 2 ** attempt) + random.uniform(0, 1))
+        return {}, [{"type": "RATE_LIMITED", "message": "retries exhausted"}]
+
+def existing_repositories(client, org, names):
+    """Return {name: node_id} for the repositories that already exist, using one GraphQL query"""
+    if not names:
+        return {}
+    fields = "\n".join(f"  r{i}: repository(owner: $owner, name: {json.dumps(name)}) {{ id }}"
+                       for i, name in enumerate(names))
+    data, errors = client.graphql(f"query($owner: String!) {{\n{fields}\n}}", {"owner": org})
+    for error in errors:
+        if error.get("type") != "NOT_FOUND":
+            raise GitHubError(200, error.get("message", "GraphQL error"), "/graphql")
+    return {name: data[f"r{i}"]["id"] for i, name in enumerate(names) if data.get(f"r{i}")}
+
+def read_issue_templates(directory=ISSUE_TEMPLATE_DIR):
+    """
+    Parse the front matter of the ISSUE_TEMPLATE markdown files.
+
+    Returns:
+        A list of {"file", "name", "title", "labels", "body"} dicts
+    """
+    templates = []
+    if not os.path.isdir(directory):
+        return templates
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".md"):
+            continue
+        with open(os.path.join(directory, file_name)) as f:
+            text = f.read()
+        meta = {}
+        body = text
+        match = re.match(r"---\n(.*?)\n---\n?(.*)", text, re.DOTALL)
+        if match:
+            for line in match.group(1).splitlines():
+                key, sep, value = line.partition(":")
+                if sep:
+                    meta[key.strip()] = value.strip().strip("'\"")
+            body = match.group(2)
+        templates.append({
+            "file": file_name,
+            "name": meta.get("name", file_name[:-3]),
+            "title": meta.get("title", ""),
+            "labels": [label.strip() for label in meta.get("labels", "").split(",") if label.strip()],
+            "body": body,
+        })
+    return templates
+
+def weekly_issues(templates, weeks):
+    """Expand week-numbered issue templates into one issue per week"""
+    issues = []
+    for template in templates:
+        if not any(p in template["title"] or p in template["body"] for p in WEEK_PLACEHOLDERS):
+            continue
+        for week in range(1, weeks + 1):
+            title = template["title"] or f"{template['name']}: Week [NUMBER]"
+            body = template["body"]
+            for placeholder in WEEK_PLACEHOLDERS:
+                title = title.replace(placeholder, str(week))
+                body = body.replace(placeholder, str(week))
+            issues.append({"title": title, "body": body, "labels": template["labels"]})
+    return issues
+
+def build_repository_files(spec, schedule=None, answers=None):
+    """
+    Render everything committed to a project repository.
+
+    answers is an optional prompt_batch.PromptAnswers whose cached answers
+    replace the templated day files, as with generate_project.py --answers.
+
+    Returns:
+        A list of (path, bytes, mode) tuples: the generated scaffold plus the
+        issue templates, workflows, CONTRIBUTING.md and ONBOARDING.md
+    """
+    project = spec["title"]
+    overrides = answers.for_project(project, spec.get("description"), schedule) if answers else {}
+    files = [(path, overrides.get(path, data), mode) for path, data, mode in
+             generate_project.iter_project_files(project, spec.get("description"), schedule, spec.get("tools"))
+             if data is not None]
+    files.append(("CONTRIBUTING.md", CONTRIBUTING_TEMPLATE.format(project=project).encode(), None))
+    files.append(("ONBOARDING.md", ONBOARDING_TEMPLATE.format(project=project).encode(), None))
+    for directory, prefix in ((ISSUE_TEMPLATE_DIR, ".github/ISSUE_TEMPLATE"), (WORKFLOW_DIR, ".github/workflows")):
+        if not os.path.isdir(directory):
+            continue
+        for file_name in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, file_name), 'rb') as f:
+                files.append((f"{prefix}/{file_name}", f.read(), None))
+    return files
+
+def push_tree(client, org, repo, files, message, branch="main"):
+    """
+    Commit files on top of a branch with the git data API.
+
+    The whole tree is sent in one request with inline blob contents, so a
+    repository costs four API calls regardless of its size. When the
+    resulting tree equals the branch's current tree, no commit is made.
+
+    Returns:
+        (sha, changed): the branch head after the push and whether a new
+        commit was made
+    """
+    ref = client.request("GET", f"/repos/{org}/{repo}/git/ref/heads/{branch}")
+    parent = ref["object"]["sha"]
+    base_tree = client.request("GET", f"/repos/{org}/{repo}/git/commits/{parent}")["tree"]["sha"]
+    # Git objects are content-addressed, so repeating these POSTs at worst leaves an unreferenced object
+    tree = client.request("POST", f"/repos/{org}/{repo}/git/trees", {
+        "base_tree": base_tree,
+        "tree": [{"path": path, "mode": "100755" if mode and mode & 0o111 else "100644",
+                  "type": "blob", "content": data.decode()} for path, data, mode in files],
+    }, idempotent=True)
+    if tree["sha"] == base_tree:
+        return parent, False
+    commit = client.request("POST", f"/repos/{org}/{repo}/git/commits",
+                            {"message": message, "tree": tree["sha"], "parents": [parent]}, idempotent=True)
+    client.request("PATCH", f"/repos/{org}/{repo}/git/refs/heads/{branch}", {"sha": commit["sha"]})
+    return commit["sha"], True
+
+def ensure_labels(client, org, repo, labels):
+    """Create missing labels and return {label name: node_id} for the repository"""
+    for label in labels:
+        try:
+            # A repeated POST fails with the 422 handled below
+            client.request("POST", f"/repos/{org}/{repo}/labels", {"name": label, "color": "ededed"}, idempotent=True)
+        except GitHubError as e:
+            if e.status != 422:  # already_exists
+                raise
+    existing = client.request("GET", f"/repos/{org}/{repo}/labels?per_page=100")
+    return {label["name"]: label["node_id"] for label in existing}
+
+def create_issues(client, repository_id, issues, label_ids):
+    """Create issues with aliased createIssue mutations, ISSUES_PER_MUTATION at a time"""
+    created = 0
+    for start in range(0, len(issues), ISSUES_PER_MUTATION):
+        batch = issues[start:start + ISSUES_PER_MUTATION]
+        variables = {}
+        fields = []
+        for i, issue in enumerate(batch):
+            variables[f"input{i}"] = {
+                "repositoryId": repository_id,
+                "title": issue["title"],
+                "body": issue["body"],
+                "labelIds": [label_ids[name] for name in issue["labels"] if name in label_ids],
+            }
+            fields.append(f"  i{i}: createIssue(input: $input{i}) {{ issue {{ number }} }}")
+        declarations = ", ".join(f"$input{i}: CreateIssueInput!" for i in range(len(batch)))
+        data, errors = client.graphql(f"mutation({declarations}) {{\n" + "\n".join(fields) + "\n}", variables)
+        if errors:
+            raise GitHubError(200, "; ".join(error.get("message", "") for error in errors), "/graphql")
+        created += sum(1 for i in range(len(batch)) if data.get(f"i{i}"))
+    return created
+
+def provision_repository(client, org, spec, repository_id=None, schedule=None, issues=(), visibility="public",
+                         answers=None):
+    """
+    Create (if needed) and populate one project repository.
+
+    Returns:
+        A dict describing what was done
+    """
+    name = generate_project.project_slug(spec["title"])
+    start = time.perf_counter()
+    created = repository_id is None
+    if created:
+        try:
+            repo = client.request("POST", f"/orgs/{org}/repos", {
+                "name": name,
+                "description": spec.get("description", ""),
+                "visibility": visibility,
+                "auto_init": True,
+            })
+        except GitHubError as e:
+            if e.status != 0:
+                raise
+            # The response was lost in transit: the repository may have been created anyway
+            try:
+                repo = client.request("GET", f"/repos/{org}/{name}")
+            except GitHubError:
+                raise e
+        repository_id = repo["node_id"]
+
+    labels = sorted({label for template in read_issue_templates() for label in template["labels"]})
+    label_ids = ensure_labels(client, org, name, labels)
+    sha, changed = push_tree(client, org, name, build_repository_files(spec, schedule, answers),
+                             "Initial repository structure setup")
+    issue_count = create_issues(client, repository_id, list(issues), label_ids) if issues else 0
+    return {"repo": f"{org}/{name}", "created": created, "commit": sha, "changed": changed, "labels": len(labels),
+            "issues": issue_count, "seconds": time.perf_counter() - start}
+
+def provision(client, org, specs, schedule=None, concurrency=4, weekly=False, visibility="public", answers=None):
+    """
+    Provision every project repository concurrently.
+
+    Returns:
+        (results, failures) where failures is a list of (repo name, exception)
+    """
+    names = [generate_project.project_slug(spec["title"]) for spec in specs]
+    existing = existing_repositories(client, org, names)
+    issues = []
+    if weekly:
+        issues = weekly_issues(read_issue_templates(), (schedule or generate_project.DEFAULT_SCHEDULE).weeks)
+
+    results = []
+    failures = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(provision_repository, client, org, spec, existing.get(name), schedule,
+                               issues if name not in existing else (), visibility, answers): name
+                   for spec, name in zip(specs, names)}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ {org}/{name}: {e}", file=sys.stderr)
+                failures.append((name, e))
+                continue
+            action = "created" if result["created"] else "updated" if result["changed"] else "up to date"
+            print(f"✅ {result['repo']} {action}: commit {result['commit'][:7]}, "
+                  f"{result['issues']} issues in {result['seconds']:.2f}s")
+            results.append(result)
+    return results, failures
+
+def resolve_token(explicit=None):
+    """Return a token from the argument, GITHUB_TOKEN/GH_TOKEN, or `gh auth token`"""
+    token = explicit or os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token or not shutil.which("gh"):
+        return token
+    result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Provision internship project repositories on GitHub")
+    parser.add_argument("title", nargs="?", help="Title of a single project (default: every project in setup.sh)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--all", action="store_true", help="Every project listed in setup.sh (the default without a title)")
+    source.add_argument("--manifest", help="Every project listed in a JSON manifest")
+    parser.add_argument("--setup-script", default=os.path.join(REPO_ROOT, "setup.sh"), help="Setup script read by --all")
+    parser.add_argument("--schedule", help="JSON file with a \"schedule\" object (defaults to the --manifest file)")
+    parser.add_argument("--weeks", type=int, help="Number of weeks in the programme (default: 24)")
+    parser.add_argument("--days-per-week", type=int, help="Number of working days per week (default: 5)")
+    parser.add_argument("--org", default="cvt-poc", help="GitHub organisation (default: cvt-poc)")
+    parser.add_argument("--api-url", default=os.environ.get("GITHUB_API_URL", DEFAULT_API_URL), help="GitHub API base URL")
+    parser.add_argument("--token", help="API token (default: GITHUB_TOKEN, GH_TOKEN or `gh auth token`)")
+    parser.add_argument("-j", "--concurrency", type=generate_project.positive_int, default=4, help="Repositories provisioned at once (default: 4)")
+    parser.add_argument("--weekly-issues", action="store_true", help="Open one issue per week for each week-numbered issue template")
+    parser.add_argument("--private", action="store_true", help="Create private repositories")
+    parser.add_argument("--answers", metavar="DIR", help="Commit cached prompt_batch.py answers from DIR in place of the templated day files")
+    parser.add_argument("--prompt-template", help="Prompt template the answers were generated from (default: daily_prompt.md)")
+    args = parser.parse_args(argv)
+    if args.title is None and not args.manifest:
+        args.all = True
+    try:
+        specs, schedule = generate_project.resolve_projects(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    token = resolve_token(args.token)
+    if not token:
+        print("No GitHub token found: set GITHUB_TOKEN or run `gh auth login`", file=sys.stderr)
+        return 1
+
+    client = GitHubClient(token, args.api_url, max_connections=args.concurrency * 2)
+    start = time.perf_counter()
+    answers = None
+    if args.answers:
+        import prompt_batch
+        answers = prompt_batch.PromptAnswers(args.answers, args.prompt_template or prompt_batch.DEFAULT_TEMPLATE)
+    results, failures = provision(client, args.org, specs, schedule, args.concurrency, args.weekly_issues,
+                                  "private" if args.private else "public", answers)
+    print(f"📦 Provisioned {len(results)}/{len(specs)} repositories in {time.perf_counter() - start:.2f}s")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
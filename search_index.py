@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Inverted index over generated task content.
+
+The generator builds the index as a by-product of rendering (see
+generate_project.py --index): every markdown file is split into sections by
+heading, tokenised, and stored as term -> (section, frequency) postings in a
+single binary file. Sections that are identical across documents (the
+templated parts of every day file) are stored once and referenced by each
+document, and postings are delta and varint encoded. Queries memory-map the
+file and binary search the sorted term table, so lookups never rescan the
+markdown.
+
+Only documents whose content hash changed since the last build are
+re-tokenised; documents of projects that were not regenerated are kept.
+
+Usage:
+    python search_index.py tasks.idx multi-cluster helm
+    python search_index.py tasks.idx --rebuild generated/
+"""
+import os
+import re
+import sys
+import mmap
+import math
+import struct
+import hashlib
+import argparse
+import functools
+from collections import Counter
+
+import generate_project
+
+MAGIC = b"CVTIDX02"
+MAGIC_PREFIX = b"CVTIDX"
+HEADER = struct.Struct("<8sIIIIQQQQQQQ")
+DOC = struct.Struct("<IIII32s")        # path offset, path length, first reference, reference count, sha256
+REFERENCE = struct.Struct("<I")        # section id, in document order
+SECTION = struct.Struct("<IIII")       # heading offset, heading length, first occurrence, occurrence count
+OCCURRENCE = struct.Struct("<I")       # document id, grouped by section
+TERM = struct.Struct("<IIQI")          # term offset, term length, postings offset, section frequency
+# Postings are (section id delta, term frequency) varint pairs in section id order
+
+TOKEN = re.compile(r"[a-z0-9]+(?:[-+#.][a-z0-9]+)*")
+HEADING = re.compile(r"^#{1,6}\s+(.*?)\s*$", re.MULTILINE)
+TASK_PATH = re.compile(r"weekly_tasks/week-(\d+)/(?:day-(\d+)|README)\.md$")
+
+def tokenize(text):
+    """
+    Return the index terms of a piece of text.
+
+    Compound words are indexed whole and by part, so "multi-cluster" matches
+    queries for "multi-cluster", "multi" and "cluster".
+    """
+    terms = []
+    for token in TOKEN.findall(text.lower()):
+        terms.append(token)
+        parts = re.split(r"[-+#.]", token)
+        if len(parts) > 1:
+            terms.extend(part for part in parts if part)
+    return terms
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_section(text):
+    return tuple(Counter(tokenize(text)).items())
+
+def analyze(text):
+    """
+    Split markdown into sections by heading and count terms per section.
+
+    Returns:
+        A list of (heading, {term: frequency}) pairs; text before the first
+        heading belongs to the "" section
+    """
+    sections = []
+    starts = [(m.start(), m.group(1)) for m in HEADING.finditer(text)]
+    if not starts or starts[0][0] > 0:
+        starts.insert(0, (0, ""))
+    for i, (start, heading) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        # Identical sections (placeholders repeated across days) are tokenised once
+        terms = dict(_analyze_section(text[start:end]))
+        if terms:
+            sections.append((heading, terms))
+    return sections
+
+class IndexFormatError(ValueError):
+    """Raised for an index file written in an older format"""
+
+def _encode_varint(value, out):
+    while value >= 0x80:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _decode_varint(data, pos):
+    """Return (value, position after it)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+class SearchIndex:
+    """
+    Mutable form of the index, used to build and update the index file.
+
+    documents maps a relative markdown path to (sha256 hex, sections) where
+    sections is the output of analyze().
+    """
+
+    def __init__(self, documents=None):
+        self.documents = documents or {}
+
+    @classmethod
+    def load(cls, path):
+        """Read an index file back into memory, or return an empty index if it does not exist or is outdated"""
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with IndexReader(path) as reader:
+                return cls(reader.documents())
+        except IndexFormatError:
+            return cls()
+
+    def update(self, documents, replaced_prefixes=(), seen=()):
+        """
+        Merge freshly analysed documents.
+
+        Documents below one of replaced_prefixes that are neither in
+        documents nor in seen no longer exist and are dropped.
+        """
+        if replaced_prefixes:
+            keep = set(seen) | set(documents)
+            prefixes = tuple(f"{prefix}/" for prefix in replaced_prefixes)
+            for path in [p for p in self.documents if p.startswith(prefixes) and p not in keep]:
+                del self.documents[path]
+        self.documents.update(documents)
+
+    def save(self, path):
+        """Write the index file atomically"""
+        strings = bytearray()
+        interned = {}
+
+        def intern(text):
+            if text not in interned:
+                data = text.encode()
+                interned[text] = (len(strings), len(data))
+                strings.extend(data)
+            return interned[text]
+
+        docs = []
+        references = []
+        section_ids = {}
+        sections = []
+        for doc_id, doc_path in enumerate(sorted(self.documents)):
+            digest, doc_sections = self.documents[doc_path]
+            path_offset, path_length = intern(doc_path)
+            docs.append(DOC.pack(path_offset, path_length, len(references), len(doc_sections), bytes.fromhex(digest)))
+            for heading, terms in doc_sections:
+                key = (heading, tuple(sorted(terms.items())))
+                section_id = section_ids.get(key)
+                if section_id is None:
+                    section_id = section_ids[key] = len(sections)
+                    sections.append((heading, terms, []))
+                sections[section_id][2].append(doc_id)
+                references.append(REFERENCE.pack(section_id))
+
+        packed_sections = []
+        occurrences = []
+        postings_by_term = {}
+        for section_id, (heading, terms, doc_ids) in enumerate(sections):
+            packed_sections.append(SECTION.pack(*intern(heading), len(occurrences), len(doc_ids)))
+            occurrences.extend(OCCURRENCE.pack(doc_id) for doc_id in doc_ids)
+            for term, frequency in terms.items():
+                postings_by_term.setdefault(term, []).append((section_id, frequency))
+
+        terms = []
+        postings = bytearray()
+        for term in sorted(postings_by_term, key=str.encode):
+            entries = postings_by_term[term]
+            terms.append(TERM.pack(*intern(term), len(postings), len(entries)))
+            previous = 0
+            for section_id, frequency in entries:
+                _encode_varint(section_id - previous, postings)
+                _encode_varint(frequency, postings)
+                previous = section_id
+
+        docs_offset = HEADER.size
+        references_offset = docs_offset + DOC.size * len(docs)
+        sections_offset = references_offset + REFERENCE.size * len(references)
+        occurrences_offset = sections_offset + SECTION.size * len(sections)
+        terms_offset = occurrences_offset + OCCURRENCE.size * len(occurrences)
+        postings_offset = terms_offset + TERM.size * len(terms)
+        strings_offset = postings_offset + len(postings)
+        header = HEADER.pack(MAGIC, len(docs), len(sections), len(references), len(terms),
+                             docs_offset, references_offset, sections_offset, occurrences_offset,
+                             terms_offset, postings_offset, strings_offset)
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(b"".join([header, *docs, *references, *packed_sections, *occurrences, *terms,
+                              bytes(postings), bytes(strings)]))
+        os.replace(tmp_path, path)
+
+class IndexReader:
+    """
+    Query an index file through a read-only memory map.
+
+    section_count is the number of distinct sections and occurrence_count
+    the number of sections over all documents; ranking counts occurrences,
+    so sharing a section does not change its score.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic = self._map[:len(MAGIC)]
+        if magic != MAGIC:
+            self.close()
+            if magic.startswith(MAGIC_PREFIX):
+                raise IndexFormatError(f"{path} was written in an older index format; rebuild it")
+            raise ValueError(f"{path} is not a search index")
+        (_, self.doc_count, self.section_count, self.occurrence_count, self.term_count,
+         self._docs, self._references, self._sections, self._occurrences,
+         self._terms, self._postings, self._strings) = HEADER.unpack_from(self._map)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _string(self, offset, length):
+        start = self._strings + offset
+        return self._map[start:start + length]
+
+    def _term(self, i):
+        return TERM.unpack_from(self._map, self._terms + i * TERM.size)
+
+    def _find_term(self, term):
+        """Binary search the sorted term table; returns (postings offset, section frequency) or None"""
+        key = term.encode()
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, length, first, count = self._term(mid)
+            candidate = self._string(offset, length)
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return first, count
+        return None
+
+    def _iter_postings(self, first, count):
+        pos = self._postings + first
+        section_id = 0
+        for _ in range(count):
+            delta, pos = _decode_varint(self._map, pos)
+            frequency, pos = _decode_varint(self._map, pos)
+            section_id += delta
+            yield section_id, frequency
+
+    def _section(self, section_id):
+        return SECTION.unpack_from(self._map, self._sections + section_id * SECTION.size)
+
+    def occurrences(self, section_id):
+        """Return the (document path, heading) pairs of every occurrence of a section"""
+        heading_offset, heading_length, first, count = self._section(section_id)
+        heading = self._string(heading_offset, heading_length).decode()
+        start = self._occurrences + first * OCCURRENCE.size
+        result = []
+        for (doc_id,) in OCCURRENCE.iter_unpack(self._map[start:start + count * OCCURRENCE.size]):
+            path_offset, path_length, _, _, _ = DOC.unpack_from(self._map, self._docs + doc_id * DOC.size)
+            result.append((self._string(path_offset, path_length).decode(), heading))
+        return result
+
+    def search(self, query, limit=10):
+        """
+        Rank sections by tf-idf over the query terms.
+
+        Sections matching more distinct query terms always rank first.
+
+        Returns:
+            A list of (score, path, heading) tuples, best first
+        """
+        scores = {}
+        matched = Counter()
+        for term in dict.fromkeys(tokenize(query)):
+            found = self._find_term(term)
+            if not found:
+                continue
+            postings = list(self._iter_postings(*found))
+            df = sum(self._section(section_id)[3] for section_id, _ in postings)
+            idf = math.log(1 + self.occurrence_count / df)
+            for section_id, frequency in postings:
+                scores[section_id] = scores.get(section_id, 0.0) + (1 + math.log(frequency)) * idf
+                matched[section_id] += 1
+        results = []
+        for s in sorted(scores, key=lambda s: (matched[s], scores[s]), reverse=True):
+            results.extend((scores[s], path, heading) for path, heading in self.occurrences(s))
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def documents(self):
+        """Decode the whole index into SearchIndex.documents form"""
+        sections = []
+        for heading_offset, heading_length, _, _ in SECTION.iter_unpack(
+                self._map[self._sections:self._sections + self.section_count * SECTION.size]):
+            sections.append((self._string(heading_offset, heading_length).decode(), {}))
+        terms = self._map[self._terms:self._terms + self.term_count * TERM.size]
+        for offset, length, first, count in TERM.iter_unpack(terms):
+            term = self._string(offset, length).decode()
+            for section_id, frequency in self._iter_postings(first, count):
+                sections[section_id][1][term] = frequency
+        references = self._map[self._references:self._references + self.occurrence_count * REFERENCE.size]
+        references = [section_id for (section_id,) in REFERENCE.iter_unpack(references)]
+        documents = {}
+        for doc_id in range(self.doc_count):
+            path_offset, path_length, first, count, digest = DOC.unpack_from(self._map, self._docs + doc_id * DOC.size)
+            path = self._string(path_offset, path_length).decode()
+            documents[path] = (digest.hex(), [sections[section_id] for section_id in references[first:first + count]])
+        return documents
+
+    def hashes(self):
+        """Return {path: sha256 hex} without decoding any postings"""
+        result = {}
+        for doc_id in range(self.doc_count):
+            path_offset, path_length, _, _, digest = DOC.unpack_from(self._map, self._docs + doc_id * DOC.size)
+            result[self._string(path_offset, path_length).decode()] = digest.hex()
+        return result
+
+class Indexer:
+    """
+    Collect index documents while a project is written.
+
+    known maps paths to the content hashes already in the index; files whose
+    hash matches are recorded as seen but not re-tokenised. Indexers are
+    picklable so worker processes can send their results back.
+
+    A partial indexer is given only some files of each project (as by
+    generate_project.py --watch), so the documents it did not see are kept
+    rather than dropped.
+    """
+
+    def __init__(self, known=None, partial=False):
+        self.known = known or {}
+        self.partial = partial
+        self.documents = {}
+        self.seen = set()
+        self.prefixes = set()
+
+    @classmethod
+    def for_index(cls, path, partial=False):
+        """Create an indexer that updates an existing index file (if any; an outdated one is replaced)"""
+        if not os.path.exists(path):
+            return cls(partial=partial)
+        try:
+            with IndexReader(path) as reader:
+                return cls(reader.hashes(), partial)
+        except IndexFormatError:
+            return cls(partial=partial)
+
+    def fork(self, prefix):
+        """Return an empty indexer that only knows the documents below prefix"""
+        return Indexer({p: h for p, h in self.known.items() if p.startswith(f"{prefix}/")}, self.partial)
+
+    def merge(self, other):
+        self.documents.update(other.documents)
+        self.seen |= other.seen
+        self.prefixes |= other.prefixes
+
+    def wrap(self, sink):
+        return IndexingSink(sink, self)
+
+    def add(self, path, data):
+        top, sep, _ = path.partition("/")
+        if sep and not self.partial:
+            self.prefixes.add(top)
+        self.seen.add(path)
+        digest = hashlib.sha256(data).hexdigest()
+        if self.known.get(path) != digest:
+            self.documents[path] = (digest, analyze(data.decode()))
+
+    def save(self, path):
+        """Apply the collected changes to the index file and return the number of re-indexed documents"""
+        prefixes = tuple(f"{prefix}/" for prefix in self.prefixes)
+        removed = any(p.startswith(prefixes) and p not in self.seen for p in self.known) if prefixes else False
+        if os.path.exists(path) and not self.documents and not removed:
+            return 0
+        index = SearchIndex.load(path)
+        index.update(self.documents, self.prefixes, self.seen)
+        index.save(path)
+        return len(self.documents)
+
+class IndexingSink(generate_project.ForwardingSink):
+    """Forward entries to another sink and feed markdown files to an Indexer"""
+
+    def __init__(self, inner, indexer):
+        super().__init__(inner)
+        self.indexer = indexer
+
+    def write(self, path, data, mode=None):
+        if path.endswith(".md"):
+            self.indexer.add(path, data)
+        super().write(path, data, mode)
+
+def rebuild(index_path, root):
+    """Index every markdown file below root from scratch"""
+    index = SearchIndex()
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = [d for d in dir_names if not d.startswith(".")]
+        for file_name in file_names:
+            if file_name.endswith(".md"):
+                full_path = os.path.join(dir_path, file_name)
+                with open(full_path, 'rb') as f:
+                    data = f.read()
+                rel_path = os.path.relpath(full_path, root).replace(os.sep, "/")
+                index.documents[rel_path] = (hashlib.sha256(data).hexdigest(), analyze(data.decode()))
+    index.save(index_path)
+    return len(index.documents)
+
+def describe(path):
+    """Return a short "project week N day D" label for a task path"""
+    project = path.split("/", 1)[0]
+    match = TASK_PATH.search(path)
+    if not match:
+        return project
+    week, day = match.groups()
+    return f"{project} week {week}" + (f" day {day}" if day else "")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search generated task content")
+    parser.add_argument("index", help="Index file (built by generate_project.py --index)")
+    parser.add_argument("query", nargs="*", help="Search terms")
+    parser.add_argument("-k", "--limit", type=int, default=10, help="Number of results (default: 10)")
+    parser.add_argument("--rebuild", metavar="ROOT", help="Index every markdown file below ROOT instead of querying")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        count = rebuild(args.index, args.rebuild)
+        print(f"🔎 Indexed {count} documents into {args.index}")
+        return 0
+    if not args.query:
+        parser.error("a query is required")
+
+    try:
+        reader = IndexReader(args.index)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    with reader:
+        results = reader.search(" ".join(args.query), args.limit)
+        for score, path, heading in results:
+            print(f"{score:7.2f}  {describe(path):<32} {path}" + (f"  § {heading}" if heading else ""))
+    return 0 if results else 1
+
+if __name__ == "__main__":
+    sys.exit(main())